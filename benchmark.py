@@ -0,0 +1,523 @@
+#!/usr/bin/env python3
+"""
+BENCHMARK SCRIPT - Performans ve Doğruluk Testleri
+1. Fark testleri: error_detection'daki kontrol yöntemleri (akış sınıfları dahil), verify_data ve
+   server bozucuları, aşağıdaki referans implementasyonlarla birebir aynı
+   çıktıyı vermeli (optimizasyonlar davranışı değiştirmemeli).
+2. Performans: her fonksiyon 16 B - 64 MB arası veri boyutlarında ölçülür,
+   sonuçlar baseline dosyasıyla karşılaştırılır; eşikten fazla yavaşlama
+   varsa script 1 ile çıkar.
+
+Kullanım:
+  python benchmark.py --save-baseline        # baseline oluştur
+  python benchmark.py                        # baseline ile karşılaştır
+  python benchmark.py --max-size 64M         # tüm boyutlar (uzun sürer)
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+import client2
+import error_detection
+import server
+
+BASELINE_FILE = 'bench_baseline.json'
+
+# 16 B, 256 B, 4 KB, 64 KB, 1 MB, 16 MB, 64 MB
+SIZES = [16, 256, 4 * 1024, 64 * 1024, 1024 * 1024, 16 * 1024 * 1024, 64 * 1024 * 1024]
+
+# Bir ölçüm en az bu kadar sürecek şekilde tekrarlanır
+MIN_TIME = 0.2
+
+def print_header(text):
+    print("\n" + "=" * 70)
+    print(f"  {text}")
+    print("=" * 70)
+
+def print_step(step_num, text):
+    print(f"\n[ADIM {step_num}] {text}")
+    print("-" * 70)
+
+def parse_size(text):
+    """'64M', '4K', '256' gibi boyutları byte'a çevirir."""
+    units = {'K': 1024, 'M': 1024 * 1024}
+    text = text.strip().upper()
+    if text and text[-1] in units:
+        return int(text[:-1]) * units[text[-1]]
+    return int(text)
+
+# ==================== REFERANS İMPLEMENTASYONLAR ====================
+# Bu fonksiyonlar ilk sürümdeki davranışı sabitler; DEĞİŞTİRMEYİN.
+
+def reference_even_parity(data):
+    return ''.join('1' if bin(ord(char)).count('1') % 2 == 1 else '0' for char in data)
+
+def reference_crc16(data):
+    crc = 0xFFFF
+    for char in data:
+        crc ^= (ord(char) << 8)
+        for _ in range(8):
+            if crc & 0x8000:
+                crc = (crc << 1) ^ 0x1021
+            else:
+                crc = crc << 1
+            crc &= 0xFFFF
+    return format(crc, '04X')
+
+def reference_internet_checksum(data):
+    data_bytes = data.encode('utf-8')
+    if len(data_bytes) % 2 == 1:
+        data_bytes += b'\x00'
+    total = 0
+    for i in range(0, len(data_bytes), 2):
+        total += (data_bytes[i] << 8) + data_bytes[i + 1]
+        total = (total & 0xFFFF) + (total >> 16)
+    return format(~total & 0xFFFF, '04X')
+
+def reference_2d_parity_matrix(data):
+    block_size = 8
+    blocks = []
+    for i in range(0, len(data), block_size):
+        blocks.append(data[i:i + block_size].ljust(block_size))
+    while len(blocks) < block_size:
+        blocks.append(' ' * block_size)
+
+    matrix = [[format(ord(char), '08b') for char in block] for block in blocks]
+
+    row_parities = ['1' if ''.join(row).count('1') % 2 == 1 else '0' for row in matrix]
+    col_parities = []
+    for col_idx in range(block_size):
+        for bit_idx in range(8):
+            ones = sum(1 for row in matrix if row[col_idx][bit_idx] == '1')
+            col_parities.append('1' if ones % 2 == 1 else '0')
+
+    all_parities = ''.join(row_parities) + ''.join(col_parities)
+    hex_result = ''
+    for i in range(0, len(all_parities), 4):
+        hex_result += format(int(all_parities[i:i + 4].ljust(4, '0'), 2), 'X')
+    return hex_result
+
+def reference_2d_parity(data):
+    # 2D Parity 8x8 karolarla hesaplanır: her 64 karakterlik parça için
+    # ilk sürümdeki tek matrisli hesaplamanın sonucu art arda eklenir.
+    tiles = [data[i:i + 64] for i in range(0, len(data), 64)] or ['']
+    return ''.join(reference_2d_parity_matrix(tile) for tile in tiles)
+
+def reference_2d_parity_tiles(data, rows, cols):
+    # Genel rows x cols karo referansı; 8x8'de reference_2d_parity ile aynı olmalı
+    tiles = [data[i:i + rows * cols] for i in range(0, len(data), rows * cols)] or ['']
+    hex_result = ''
+    for tile in tiles:
+        blocks = [tile[i:i + cols].ljust(cols) for i in range(0, len(tile), cols)]
+        while len(blocks) < rows:
+            blocks.append(' ' * cols)
+        matrix = [[format(ord(char), '08b') for char in block] for block in blocks]
+
+        row_parities = ['1' if ''.join(row).count('1') % 2 == 1 else '0' for row in matrix]
+        col_parities = []
+        for col_idx in range(cols):
+            for bit_idx in range(8):
+                ones = sum(1 for row in matrix if row[col_idx][bit_idx] == '1')
+                col_parities.append('1' if ones % 2 == 1 else '0')
+
+        all_parities = ''.join(row_parities) + ''.join(col_parities)
+        for i in range(0, len(all_parities), 4):
+            hex_result += format(int(all_parities[i:i + 4].ljust(4, '0'), 2), 'X')
+    return hex_result
+
+# Varsayılan dışı karo boyutları için denenen geometriler (satır, sütun)
+TILE_GEOMETRIES = [(1, 1), (3, 5), (4, 16), (16, 4), (7, 9), (64, 1)]
+
+REFERENCE_CODECS = {
+    'PARITY': reference_even_parity,
+    'CRC16': reference_crc16,
+    'CHECKSUM': reference_internet_checksum,
+    '2D_PARITY': reference_2d_parity,
+}
+
+def reference_verify_data(data, method, received_control):
+    if method not in REFERENCE_CODECS:
+        return None, "UNKNOWN METHOD"
+    computed_control = REFERENCE_CODECS[method](data)
+    status = "DATA CORRECT ✓" if computed_control == received_control else "DATA CORRUPTED ✗"
+    return computed_control, status
+
+# Bozucular: aynı random tohumuyla aynı çıktıyı üretmeliler
+def reference_bit_flip(data, num_flips=1):
+    data_bytes = bytearray(data.encode('utf-8'))
+    for _ in range(num_flips):
+        if len(data_bytes) == 0:
+            break
+        byte_idx = random.randint(0, len(data_bytes) - 1)
+        bit_idx = random.randint(0, 7)
+        data_bytes[byte_idx] ^= (1 << bit_idx)
+    return data_bytes.decode('utf-8', errors='replace')
+
+def reference_character_substitution(data):
+    if len(data) == 0:
+        return data
+    idx = random.randint(0, len(data) - 1)
+    new_char = chr(random.randint(65, 90))
+    return data[:idx] + new_char + data[idx + 1:]
+
+def reference_character_deletion(data):
+    if len(data) <= 1:
+        return data
+    idx = random.randint(0, len(data) - 1)
+    return data[:idx] + data[idx + 1:]
+
+def reference_character_insertion(data):
+    if len(data) == 0:
+        return data
+    idx = random.randint(0, len(data))
+    new_char = chr(random.randint(97, 122))
+    return data[:idx] + new_char + data[idx:]
+
+def reference_character_swap(data):
+    if len(data) < 2:
+        return data
+    idx = random.randint(0, len(data) - 2)
+    return data[:idx] + data[idx + 1] + data[idx] + data[idx + 2:]
+
+def reference_burst_error(data):
+    if len(data) < 3:
+        return reference_character_substitution(data)
+    burst_length = random.randint(3, min(8, len(data)))
+    start_idx = random.randint(0, len(data) - burst_length)
+    corrupted = list(data)
+    for i in range(start_idx, start_idx + burst_length):
+        corrupted[i] = chr(random.randint(65, 90))
+    return ''.join(corrupted)
+
+def reference_multiple_bit_flips(data):
+    return reference_bit_flip(data, random.randint(2, 5))
+
+def planned_corruption_ok(error_type, data, corrupted):
+    """
+    Önceden planlanan bozmanın referans bozucunun yapabileceği bir sonuç
+    olup olmadığını kontrol eder (ör. swap bitişik, burst 3-min(8, n)
+    karakter). Bit çevirmeler byte düzeyinde olduğu için kontrol edilmez.
+    """
+    n = len(data)
+    if error_type == '2' or (error_type == '7' and n < 3):  # substitution
+        if n == 0:
+            return corrupted == data
+        diffs = [i for i in range(n) if corrupted[i] != data[i]]
+        return len(corrupted) == n and len(diffs) <= 1 and all('A' <= corrupted[i] <= 'Z' for i in diffs)
+    if error_type == '3':  # deletion
+        if n <= 1:
+            return corrupted == data
+        return any(data[:i] + data[i + 1:] == corrupted for i in range(n))
+    if error_type == '4':  # insertion
+        if n == 0:
+            return corrupted == data
+        return any('a' <= corrupted[i] <= 'z' and corrupted[:i] + corrupted[i + 1:] == data
+                   for i in range(n + 1))
+    if error_type == '5':  # swap
+        if n < 2:
+            return corrupted == data
+        return any(data[:i] + data[i + 1] + data[i] + data[i + 2:] == corrupted for i in range(n - 1))
+    if error_type == '7':  # burst
+        return len(corrupted) == n and any(
+            all('A' <= c <= 'Z' for c in corrupted[start:start + length])
+            and corrupted[:start] == data[:start]
+            and corrupted[start + length:] == data[start + length:]
+            for length in range(3, min(8, n) + 1)
+            for start in range(n - length + 1))
+    return True
+
+REFERENCE_CORRUPTORS = {
+    'bit_flip': reference_bit_flip,
+    'character_substitution': reference_character_substitution,
+    'character_deletion': reference_character_deletion,
+    'character_insertion': reference_character_insertion,
+    'character_swap': reference_character_swap,
+    'burst_error': reference_burst_error,
+    'multiple_bit_flips': reference_multiple_bit_flips,
+}
+
+# ==================== TEST VERİSİ ====================
+
+def make_text(size, seed=0, alphabet=None):
+    """Tekrarlanabilir, size karakterlik metin üretir."""
+    rng = random.Random(seed)
+    if alphabet is None:
+        alphabet = 'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789 .,'
+    return ''.join(rng.choices(alphabet, k=size))
+
+def differential_inputs():
+    inputs = ['', 'A', 'HELLO', 'TEST', 'MATRIX TEST DATA', 'This is a longer test message',
+              'Çok güzel bir gün, şimdi ığdır öğleni', '\x00\x7f\xff', ' ' * 64]
+    for size in (1, 2, 3, 7, 8, 9, 63, 64, 65, 127, 128, 129, 500, 4096):
+        inputs.append(make_text(size, seed=size))
+        inputs.append(make_text(size, seed=size, alphabet='aşçğıöüİ€𝄞 XYZ'))
+    return inputs
+
+# ==================== FARK TESTLERİ ====================
+
+def differential_tests():
+    """Tüm fonksiyonları referansla karşılaştırır; hata sayısını döndürür."""
+    failures = 0
+    inputs = differential_inputs()
+
+    for method, reference in REFERENCE_CODECS.items():
+        func = error_detection.get_method(method).compute
+        bad = [data for data in inputs if func(data) != reference(data)]
+        label = f"error_detection {method}"
+        if bad:
+            failures += 1
+            print(f"  ✗ {label:45s} - {len(bad)} girdi farklı (ilk: {bad[0][:20]!r})")
+        else:
+            print(f"  ✓ {label:45s} - {len(inputs)} girdi")
+
+    # Genel karo referansı 8x8'de ilk sürümün referansıyla aynı olmalı
+    bad = [data for data in inputs if reference_2d_parity_tiles(data, 8, 8) != reference_2d_parity(data)]
+    label = "reference_2d_parity_tiles 8x8"
+    if bad:
+        failures += 1
+        print(f"  ✗ {label:45s} - {len(bad)} girdi farklı (ilk: {bad[0][:20]!r})")
+    else:
+        print(f"  ✓ {label:45s} - {len(inputs)} girdi")
+
+    for rows, cols in TILE_GEOMETRIES:
+        method = error_detection.get_method(f"2D_PARITY:{rows}x{cols}")
+        bad = [data for data in inputs if method.compute(data) != reference_2d_parity_tiles(data, rows, cols)]
+        label = f"error_detection {method.wire_id}"
+        if bad:
+            failures += 1
+            print(f"  ✗ {label:45s} - {len(bad)} girdi farklı (ilk: {bad[0][:20]!r})")
+        else:
+            print(f"  ✓ {label:45s} - {len(inputs)} girdi")
+
+    # Akış sınıfları: rastgele parçalara bölünen veri tek seferlik hesapla aynı sonucu vermeli
+    rng = random.Random(0)
+    geometries = [error_detection.get_method(f"2D_PARITY:{rows}x{cols}") for rows, cols in TILE_GEOMETRIES]
+    for method in list(error_detection.METHODS.values()) + geometries:
+        bad = 0
+        for data in inputs:
+            for _ in range(3):
+                stream = method.stream()
+                start = 0
+                while start < len(data):
+                    end = start + rng.randint(1, 100)
+                    stream.update(data[start:end])
+                    start = end
+                if stream.hexdigest() != method.compute(data):
+                    bad += 1
+        label = f"error_detection {method.wire_id} stream"
+        if bad:
+            failures += 1
+            print(f"  ✗ {label:45s} - {bad} bölme farklı")
+        else:
+            print(f"  ✓ {label:45s} - {len(inputs) * 3} rastgele bölme")
+
+    bad = 0
+    for data in inputs:
+        for method in list(REFERENCE_CODECS) + ['UNKNOWN']:
+            for control in ('0000', REFERENCE_CODECS.get(method, reference_crc16)(data)):
+                if client2.verify_data(data, method, control) != reference_verify_data(data, method, control):
+                    bad += 1
+    if bad:
+        failures += 1
+        print(f"  ✗ {'client2.verify_data':45s} - {bad} durum farklı")
+    else:
+        print(f"  ✓ {'client2.verify_data':45s} - tüm yöntemler")
+
+    for name, reference in REFERENCE_CORRUPTORS.items():
+        func = getattr(server, name)
+        bad = 0
+        for seed, data in enumerate(inputs):
+            random.seed(seed)
+            expected = reference(data)
+            random.seed(seed)
+            if func(data) != expected:
+                bad += 1
+        label = f"server.{name}"
+        if bad:
+            failures += 1
+            print(f"  ✗ {label:45s} - {bad} girdi farklı")
+        else:
+            print(f"  ✓ {label:45s} - {len(inputs)} girdi")
+
+    # Bozma planları: aynı seed, parti boyutundan bağımsız olarak aynı sonucu vermeli
+    first = server.CorruptionPlanner(seed=42)
+    second = server.CorruptionPlanner(seed=42, batch_size=7)
+    bad = sum(1 for data in inputs * 20 if first.corrupt(data) != second.corrupt(data))
+    if bad:
+        failures += 1
+        print(f"  ✗ {'server.CorruptionPlanner':45s} - {bad} plan farklı")
+    else:
+        print(f"  ✓ {'server.CorruptionPlanner':45s} - seed ile tekrarlanabilir")
+
+    # Bozma planları referans bozucuların davranışını korumalı
+    short_inputs = [data for data in inputs if len(data) <= 500]
+    for error_type in ('2', '3', '4', '5', '7'):
+        planner = server.CorruptionPlanner(error_type, seed=int(error_type))
+        bad = 0
+        for data in short_inputs * 20:
+            corrupted, _ = planner.corrupt(data)
+            if not planned_corruption_ok(error_type, data, corrupted):
+                bad += 1
+        label = f"CorruptionPlanner {server.ERROR_METHODS[error_type][0]}"
+        if bad:
+            failures += 1
+            print(f"  ✗ {label:45s} - {bad} bozma referans davranışına uymuyor")
+        else:
+            print(f"  ✓ {label:45s} - {len(short_inputs) * 20} bozma")
+
+    return failures
+
+# ==================== PERFORMANS ====================
+
+def benchmark_targets():
+    """(isim, fonksiyon) çiftleri; fonksiyon tek bir metin argümanı alır."""
+    targets = []
+    for func_name in ('calculate_even_parity', 'calculate_crc16',
+                      'calculate_internet_checksum', 'calculate_2d_parity'):
+        targets.append((f"error_detection.{func_name}", getattr(error_detection, func_name)))
+    targets.append(('client2.verify_data', lambda data: client2.verify_data(data, 'CRC16', '0000')))
+    for name in REFERENCE_CORRUPTORS:
+        targets.append((f"server.{name}", getattr(server, name)))
+    targets.append(('server.corrupt_data', server.corrupt_data))
+    targets.append(('server.CorruptionPlanner.corrupt', server.CorruptionPlanner(seed=0).corrupt))
+    return targets
+
+# Planlayıcı, paket başına işi azaltmak için var: her hata tipinde
+# corrupt_data'dan hızlı olmalı. Bu uzunlukta bir yük ile ölçülür.
+PLANNER_PAYLOAD = 26
+PLANNER_CALLS = 20000
+
+def time_per_call(funcs, data, repeats=7):
+    """
+    Her fonksiyon için çağrı başına en iyi süreyi (saniye) döndürür.
+    Ölçümler dönüşümlü yapılır; makinedeki anlık yük hepsini aynı etkiler.
+    """
+    best = [None] * len(funcs)
+    for _ in range(repeats):
+        for i, func in enumerate(funcs):
+            start = time.perf_counter()
+            for _ in range(PLANNER_CALLS):
+                func(data)
+            elapsed = (time.perf_counter() - start) / PLANNER_CALLS
+            best[i] = elapsed if best[i] is None else min(best[i], elapsed)
+    return best
+
+def planner_comparison():
+    """Planlayıcıyı her hata tipinde corrupt_data ile karşılaştırır; yavaş kalan tip sayısını döndürür."""
+    data = make_text(PLANNER_PAYLOAD, seed=PLANNER_PAYLOAD)
+    slower = 0
+    random.seed(0)
+    for error_type in server.ERROR_TYPES + [None]:
+        planner = server.CorruptionPlanner(error_type, seed=0)
+        planned, direct = time_per_call(
+            [planner.corrupt, lambda d: server.corrupt_data(d, error_type)], data)
+        name = server.ERROR_METHODS[error_type][0] if error_type else 'Rastgele tip'
+        line = f"{name:25s} planlayıcı {planned * 1e6:5.2f} µs  corrupt_data {direct * 1e6:5.2f} µs"
+        if planned >= direct:
+            slower += 1
+            print(f"  ✗ {line}")
+        else:
+            print(f"  ✓ {line}  (x{direct / planned:.1f})")
+    return slower
+
+def measure(func, data):
+    """func(data) için saniye başına byte döndürür."""
+    iterations = 0
+    start = time.perf_counter()
+    elapsed = 0.0
+    while elapsed < MIN_TIME or iterations == 0:
+        func(data)
+        iterations += 1
+        elapsed = time.perf_counter() - start
+    return len(data) * iterations / elapsed
+
+def run_benchmarks(sizes, name_filter=None):
+    results = {}
+    random.seed(0)
+    for size in sizes:
+        data = make_text(size, seed=size)
+        for name, func in benchmark_targets():
+            if name_filter and name_filter not in name:
+                continue
+            throughput = measure(func, data)
+            results[f"{name}@{size}"] = throughput
+            print(f"  {name:45s} {size:>10,} B  {throughput / 1e6:10.2f} MB/s")
+    return results
+
+def compare(results, baseline, threshold):
+    """Baseline'a göre eşikten fazla yavaşlayan ölçümlerin sayısını döndürür."""
+    regressions = 0
+    for key, throughput in results.items():
+        if key not in baseline:
+            continue
+        ratio = throughput / baseline[key]
+        if ratio < 1 - threshold:
+            regressions += 1
+            print(f"  ✗ {key:55s} %{(1 - ratio) * 100:.0f} yavaşladı")
+    return regressions
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Performans ve doğruluk testleri")
+    parser.add_argument('--max-size', default='1M',
+                        help="ölçülecek en büyük veri boyutu (varsayılan 1M, en fazla 64M)")
+    parser.add_argument('--filter', default=None, help="yalnızca adı bu metni içeren fonksiyonlar")
+    parser.add_argument('--baseline', default=BASELINE_FILE, help="baseline dosyası")
+    parser.add_argument('--save-baseline', action='store_true', help="sonuçları baseline olarak kaydet")
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help="izin verilen en fazla yavaşlama oranı (0.25 = %%25)")
+    parser.add_argument('--skip-bench', action='store_true', help="yalnızca fark testlerini çalıştır")
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    print_header("BENCHMARK SCRIPT")
+
+    print_step(1, "Fark Testleri (referans implementasyonlarla)")
+    failures = differential_tests()
+    if failures:
+        print(f"\n✗ {failures} fonksiyon referanstan farklı sonuç üretiyor!")
+        sys.exit(1)
+
+    if args.skip_bench:
+        return
+
+    print_step(2, "Planlayıcı / corrupt_data Karşılaştırması")
+    slower = planner_comparison()
+    if slower:
+        print(f"\n✗ Planlayıcı {slower} durumda corrupt_data'dan hızlı değil!")
+        sys.exit(1)
+
+    print_step(3, "Performans Ölçümü")
+    max_size = parse_size(args.max_size)
+    results = run_benchmarks([size for size in SIZES if size <= max_size], args.filter)
+
+    print_step(4, "Baseline Karşılaştırması")
+    if args.save_baseline:
+        baseline = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline, 'r', encoding='utf-8') as f:
+                baseline = json.load(f)
+        baseline.update(results)
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+        print(f"  ✓ {len(results)} sonuç kaydedildi: {args.baseline}")
+        return
+
+    if not os.path.exists(args.baseline):
+        print(f"  Baseline bulunamadı ({args.baseline}). Önce --save-baseline ile oluşturun.")
+        return
+
+    with open(args.baseline, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+    regressions = compare(results, baseline, args.threshold)
+    if regressions:
+        print(f"\n✗ {regressions} ölçüm %{args.threshold * 100:.0f} eşiğinden fazla yavaşladı!")
+        sys.exit(1)
+    print(f"  ✓ Yavaşlama yok (eşik: %{args.threshold * 100:.0f})")
+
+if __name__ == "__main__":
+    main()
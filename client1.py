@@ -1,129 +1,53 @@
 
+import argparse
 import socket
 import sys
+import time
 
-# ==================== KONTROL BİLGİSİ HESAPLAMA FONKSİYONLARI ====================
+from compression import compress_text, CODEC_NONE
+from error_detection import METHODS, parity2d_method, parse_geometry
+# Kontrol fonksiyonları client1.calculate_* adlarıyla da erişilebilir kalır
+from error_detection import (calculate_even_parity as calculate_even_parity,
+                             calculate_crc16 as calculate_crc16,
+                             calculate_internet_checksum as calculate_internet_checksum,
+                             calculate_2d_parity as calculate_2d_parity)
+from feedback import choose_method, record_cost
+from profiling import PacketProfiler
+from ring_buffer import RingBuffer, ring_name
 
-def calculate_even_parity(data):
-    """
-    Even Parity hesaplar.
-    Her karakter için ASCII değerindeki 1'lerin sayısı çift olmalı.
-    """
-    parity_bits = []
-    for char in data:
-        ascii_val = ord(char)
-        # Bit sayısını hesapla
-        ones_count = bin(ascii_val).count('1')
-        # Çift parite için: eğer tek sayıda 1 varsa parite biti 1, yoksa 0
-        parity_bit = '1' if ones_count % 2 == 1 else '0'
-        parity_bits.append(parity_bit)
-    
-    return ''.join(parity_bits)
+# Menü seçimi -> yöntem wire id'si
+MENU = {
+    '1': "PARITY",
+    '2': "CRC16",
+    '3': "CHECKSUM",
+    '4': "2D_PARITY",
+}
 
-def calculate_crc16(data):
-    """
-    CRC-16 hesaplar (CRC-16-CCITT polinomu kullanarak).
-    Polinom: x^16 + x^12 + x^5 + 1 (0x1021)
-    """
-    polynomial = 0x1021  # CRC-16-CCITT
-    crc = 0xFFFF  # Başlangıç değeri
-    
-    for char in data:
-        byte = ord(char)
-        crc ^= (byte << 8)
-        
-        for _ in range(8):
-            if crc & 0x8000:
-                crc = (crc << 1) ^ polynomial
-            else:
-                crc = crc << 1
-            crc &= 0xFFFF  # 16 bit'te tut
-    
-    return format(crc, '04X')  # 4 haneli hex olarak döndür
+# ==================== ANA PROGRAM ====================
 
-def calculate_internet_checksum(data):
-    data_bytes = data.encode('utf-8')  # 1. Metni byte dizisine çevir.
-    
-    # 2. EĞER byte sayısı tekse (örn: 3 byte), sonuna 0 ekleyip çiftle.
-    if len(data_bytes) % 2 == 1:
-        data_bytes += b'\x00'
-    
-    total = 0
-    # 3. Veriyi 2'şer byte (16-bit) atlayarak gez.
-    for i in range(0, len(data_bytes), 2):
-        # 4. İki byte'ı birleştirip 16 bitlik bir kelime (word) yap.
-        word = (data_bytes[i] << 8) + data_bytes[i + 1]
-        total += word  # 5. Toplama ekle.
-        
-        # 6. TAŞMA KONTROLÜ: Eğer sayı 16 bitten büyükse, taşan kısmı başa ekle.
-        total = (total & 0xFFFF) + (total >> 16)
-    
-    # 7. Sonucun tersini al (NOT işlemi) ve 16 bit ile maskele.
-    checksum = ~total & 0xFFFF
-    
-    return format(checksum, '04X') # 8. Hex formatında döndür.
+def parse_args():
+    parser = argparse.ArgumentParser(description="Client 1 - Data Sender")
+    parser.add_argument('--transport', choices=['tcp', 'shm'], default='tcp',
+                        help="tcp: loopback soket, shm: paylaşımlı bellek halka tamponu")
+    parser.add_argument('--compress', choices=['off', 'auto', 'zlib', 'lzma'], default='off',
+                        help="kontrol bilgisinden önce veriyi sıkıştır (auto: boyuta göre seç)")
+    parser.add_argument('--tile', type=parse_geometry, default=(8, 8),
+                        help="2D Parity karo boyutu, satır x sütun (varsayılan 8x8)")
+    parser.add_argument('--profile', type=int, default=0, metavar='N',
+                        help="N paket boyunca profil çıkar (flame graph + bellek özeti)")
+    return parser.parse_args()
 
-def calculate_2d_parity(data):
-    """
-    2D Parity hesaplar.
-    Veriyi 8x8 matrise yerleştirir, satır ve sütun pariteleri hesaplar.
-    """
-    # Veriyi 8 karakterlik bloklara böl
-    block_size = 8
-    blocks = []
-    
-    for i in range(0, len(data), block_size):
-        block = data[i:i + block_size]
-        # Eksik blokları boşlukla doldur
-        if len(block) < block_size:
-            block += ' ' * (block_size - len(block))
-        blocks.append(block)
-    
-    # Eksik satırları boşluklarla doldur
-    while len(blocks) < block_size:
-        blocks.append(' ' * block_size)
-    
-    # Matris oluştur (her karakter için 8-bit)
-    matrix = []
-    for block in blocks:
-        row_bits = []
-        for char in block:
-            bits = format(ord(char), '08b')
-            row_bits.append(bits)
-        matrix.append(row_bits)
-    
-    # Satır pariteleri
-    row_parities = []
-    for row in matrix:
-        row_str = ''.join(row)
-        ones = row_str.count('1')
-        row_parities.append('1' if ones % 2 == 1 else '0')
-    
-    # Sütun pariteleri (her bit pozisyonu için)
-    col_parities = []
-    for col_idx in range(block_size):
-        for bit_idx in range(8):
-            ones = 0
-            for row_idx in range(len(matrix)):
-                if matrix[row_idx][col_idx][bit_idx] == '1':
-                    ones += 1
-            col_parities.append('1' if ones % 2 == 1 else '0')
-    
-    # Hex formatına çevir
-    all_parities = ''.join(row_parities) + ''.join(col_parities)
-    # 4'er bit grupla ve hex'e çevir
-    hex_result = ''
-    for i in range(0, len(all_parities), 4):
-        nibble = all_parities[i:i+4]
-        if len(nibble) < 4:
-            nibble += '0' * (4 - len(nibble))
-        hex_result += format(int(nibble, 2), 'X')
-    
-    return hex_result
-
-# ==================== ANA PROGRAM ====================
+def send_packet_shm(packet, port):
+    """Paketi Server'ın paylaşımlı bellek halka tamponuna yazar."""
+    ring = RingBuffer.attach(ring_name(port))
+    try:
+        ring.send(packet.encode('utf-8'), timeout=5)
+    finally:
+        ring.close()
 
 def main():
+    args = parse_args()
+
     # Server bilgileri
     SERVER_HOST = 'localhost'
     SERVER_PORT = 5555
@@ -145,38 +69,73 @@ def main():
     print("2. CRC-16")
     print("3. Internet Checksum")
     print("4. 2D Parity")
-    
-    choice = input("\nSeçiminiz (1-4): ").strip()
-    
-    # Kontrol bilgisi hesapla
-    if choice == '1':
-        method = "PARITY"
-        control_info = calculate_even_parity(data)
-    elif choice == '2':
-        method = "CRC16"
-        control_info = calculate_crc16(data)
-    elif choice == '3':
-        method = "CHECKSUM"
-        control_info = calculate_internet_checksum(data)
-    elif choice == '4':
-        method = "2D_PARITY"
-        control_info = calculate_2d_parity(data)
+    print("5. Adaptif (bağlantı durumuna göre otomatik)")
+    
+    choice = input("\nSeçiminiz (1-5): ").strip()
+    
+    # Profil kullanıcı girdisinden sonra başlar (tek paket gönderilir)
+    profiler = None
+    if args.profile > 0:
+        profiler = PacketProfiler('client1', args.profile)
+        profiler.start()
+        profiler.packet_start()
+    
+    # Sıkıştırma: kontrol bilgisi sıkıştırılmış form üzerinden hesaplanır
+    original_data = data
+    data, codec = compress_text(data, args.compress)
+    
+    # Yöntemi belirle
+    if choice in MENU:
+        method = MENU[choice]
+    elif choice == '5':
+        computes = {wire_id: m.compute for wire_id, m in METHODS.items()}
+        method, link, error_rate = choose_method(data, computes)
+        print(f"Adaptif seçim: {method} (bağlantı: {link}, hata oranı: %{error_rate * 100:.1f})")
     else:
         print("Geçersiz seçim! Varsayılan olarak CRC-16 kullanılıyor.")
         method = "CRC16"
-        control_info = calculate_crc16(data)
+    
+    method_info = METHODS[method]
+    if method == "2D_PARITY":
+        # Karo boyutu pakette yöntem adıyla taşınır (ör. 2D_PARITY:4x16)
+        method_info = parity2d_method(*args.tile)
+    
+    # Kontrol bilgisi hesapla; adaptif modda maliyetini de kaydet
+    start = time.perf_counter_ns()
+    control_info = method_info.compute(data)
+    if choice == '5':
+        record_cost(method, (time.perf_counter_ns() - start) / max(len(data), 1))
+    method = method_info.wire_id
     
     # Paketi oluştur
-    packet = f"{data}|{method}|{control_info}"
+    packet = f"{data}|{method}|{control_info}|{codec}"
     
     print("\n" + "-" * 60)
     print("Gönderilen Paket Bilgileri:")
-    print(f"  Veri            : {data}")
+    print(f"  Veri            : {original_data}")
+    if codec != CODEC_NONE:
+        print(f"  Sıkıştırma      : {codec} ({len(original_data.encode('utf-8')):,} → {len(data):,} byte)")
     print(f"  Yöntem          : {method}")
     print(f"  Kontrol Bilgisi : {control_info}")
     print(f"  Paket           : {packet}")
     print("-" * 60)
     
+    # Paylaşımlı bellek üzerinden gönder
+    if args.transport == 'shm':
+        try:
+            send_packet_shm(packet, SERVER_PORT)
+            print(f"\n✓ Paket paylaşımlı belleğe yazıldı: {ring_name(SERVER_PORT)}")
+            if profiler is not None:
+                profiler.packet_done()
+        except FileNotFoundError:
+            print(f"\n✗ Hata: Server halka tamponu bulunamadı ({ring_name(SERVER_PORT)})")
+            print("  Lütfen önce server'ı başlatın: python server.py --transport shm")
+            sys.exit(1)
+        except Exception as e:
+            print(f"\n✗ Hata oluştu: {e}")
+            sys.exit(1)
+        return
+    
     # Server'a bağlan ve gönder
     try:
         client_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
@@ -187,6 +146,8 @@ def main():
         # Paketi gönder
         client_socket.send(packet.encode('utf-8'))
         print("✓ Paket gönderildi!")
+        if profiler is not None:
+            profiler.packet_done()
         
         client_socket.close()
         print("\n✓ Bağlantı kapatıldı.")
@@ -1,145 +1,89 @@
 
+import argparse
 import socket
+from collections import OrderedDict
 
+from compression import decompress_text, CODEC_NONE
+from error_detection import get_method
+# Kontrol fonksiyonları client2.calculate_* adlarıyla da erişilebilir kalır
+from error_detection import (calculate_even_parity as calculate_even_parity,
+                             calculate_crc16 as calculate_crc16,
+                             calculate_internet_checksum as calculate_internet_checksum,
+                             calculate_2d_parity as calculate_2d_parity)
+from feedback import VerdictRecorder
+from profiling import PacketProfiler
+from ring_buffer import RingBuffer, ring_name
 
 
-
-def calculate_even_parity(data):
+class VerificationCache:
     """
-    Even Parity hesaplar.
-    Her karakter için ASCII değerindeki 1'lerin sayısı çift olmalı.
+    (yöntem, veri) -> hesaplanan kontrol bilgisi için sınırlı LRU önbellek.
+    Tekrarlayan paketlerde (heartbeat, şablon mesajlar) kontrol bilgisi
+    yeniden hesaplanmaz. Anahtar verinin kendisini içerdiği için str'nin
+    önbelleğe alınmış hash'i ile arama yapılır, çakışma yanlış sonuç vermez.
     """
-    parity_bits = []
-    for char in data:
-        ascii_val = ord(char)
-        # Bit sayısını hesapla
-        ones_count = bin(ascii_val).count('1')
-        # Çift parite için: eğer tek sayıda 1 varsa parite biti 1, yoksa 0
-        parity_bit = '1' if ones_count % 2 == 1 else '0'
-        parity_bits.append(parity_bit)
-    
-    return ''.join(parity_bits)
 
-def calculate_crc16(data):
-    """
-    CRC-16 hesaplar (CRC-16-CCITT polinomu kullanarak).
-    Polinom: x^16 + x^12 + x^5 + 1 (0x1021)
-    """
-    polynomial = 0x1021  # CRC-16-CCITT
-    crc = 0xFFFF  # Başlangıç değeri
-    
-    for char in data:
-        byte = ord(char)
-        crc ^= (byte << 8)
-        
-        for _ in range(8):
-            if crc & 0x8000:
-                crc = (crc << 1) ^ polynomial
-            else:
-                crc = crc << 1
-            crc &= 0xFFFF  # 16 bit'te tut
-    
-    return format(crc, '04X')  # 4 haneli hex olarak döndür
+    def __init__(self, max_entries=1024, max_bytes=1 << 20):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
 
-def calculate_internet_checksum(data):
-    """
-    Internet Checksum (IP Checksum) hesaplar.
-    16-bit kelimeler toplamının 1'e tümleyeni.
-    """
-    # Veriyi bytes'a çevir
-    data_bytes = data.encode('utf-8')
-    
-    # Tek sayıda byte varsa sonuna 0 ekle
-    if len(data_bytes) % 2 == 1:
-        data_bytes += b'\x00'
-    
-    # 16-bit kelimelere böl ve topla
-    total = 0
-    for i in range(0, len(data_bytes), 2):
-        word = (data_bytes[i] << 8) + data_bytes[i + 1]
-        total += word
-        # Taşmayı (carry) ekle
-        total = (total & 0xFFFF) + (total >> 16)
-    
-    # 1'e tümleyen (complement)
-    checksum = ~total & 0xFFFF
-    
-    return format(checksum, '04X')
+    def get(self, method, data):
+        key = (method, data)
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
 
-def calculate_2d_parity(data):
-    """
-    2D Parity hesaplar.
-    Veriyi 8x8 matrise yerleştirir, satır ve sütun pariteleri hesaplar.
-    """
-    # Veriyi 8 karakterlik bloklara böl
-    block_size = 8
-    blocks = []
-    
-    for i in range(0, len(data), block_size):
-        block = data[i:i + block_size]
-        # Eksik blokları boşlukla doldur
-        if len(block) < block_size:
-            block += ' ' * (block_size - len(block))
-        blocks.append(block)
-    
-    # Eksik satırları boşluklarla doldur
-    while len(blocks) < block_size:
-        blocks.append(' ' * block_size)
-    
-    # Matris oluştur (her karakter için 8-bit)
-    matrix = []
-    for block in blocks:
-        row_bits = []
-        for char in block:
-            bits = format(ord(char), '08b')
-            row_bits.append(bits)
-        matrix.append(row_bits)
-    
-    # Satır pariteleri
-    row_parities = []
-    for row in matrix:
-        row_str = ''.join(row)
-        ones = row_str.count('1')
-        row_parities.append('1' if ones % 2 == 1 else '0')
-    
-    # Sütun pariteleri (her bit pozisyonu için)
-    col_parities = []
-    for col_idx in range(block_size):
-        for bit_idx in range(8):
-            ones = 0
-            for row_idx in range(len(matrix)):
-                if matrix[row_idx][col_idx][bit_idx] == '1':
-                    ones += 1
-            col_parities.append('1' if ones % 2 == 1 else '0')
-    
-    # Hex formatına çevir
-    all_parities = ''.join(row_parities) + ''.join(col_parities)
-    # 4'er bit grupla ve hex'e çevir
-    hex_result = ''
-    for i in range(0, len(all_parities), 4):
-        nibble = all_parities[i:i+4]
-        if len(nibble) < 4:
-            nibble += '0' * (4 - len(nibble))
-        hex_result += format(int(nibble, 2), 'X')
-    
-    return hex_result
+    def put(self, method, data, control):
+        # Kapasite byte cinsindendir: ASCII dışı karakterler UTF-8'de 2-4 byte tutar
+        cost = len(data.encode('utf-8')) + len(control)
+        # Kapasiteden büyük veriler önbelleğe alınmaz
+        if cost > self.max_bytes or self.max_entries <= 0:
+            return
+        key = (method, data)
+        if key in self.entries:
+            return
+        self.entries[key] = (control, cost)
+        self.size += cost
+        while len(self.entries) > self.max_entries or self.size > self.max_bytes:
+            _, (_, old_cost) = self.entries.popitem(last=False)
+            self.size -= old_cost
+
+    def stats(self):
+        total = self.hits + self.misses
+        hit_rate = self.hits / total if total else 0.0
+        return (f"{self.hits} hit / {self.misses} miss (%{hit_rate * 100:.1f}), "
+                f"{len(self.entries)} kayıt, {self.size:,} byte")
 
 
-def verify_data(data, method, received_control):
+def compute_control(data, method):
+    """Yönteme göre kontrol bilgisini hesaplar; bilinmeyen yöntemde None döndürür."""
+    method_info = get_method(method)
+    if method_info is None:
+        return None
+    return method_info.compute(data)
+
+def verify_data(data, method, received_control, cache=None):
     """
     Alınan veri için kontrol bilgisini yeniden hesaplar ve karşılaştırır.
+    cache verilirse daha önce görülmüş (yöntem, veri) çiftleri için
+    hesaplama atlanır.
     """
-    # Yönteme göre kontrol bilgisini hesapla
-    if method == "PARITY":
-        computed_control = calculate_even_parity(data)
-    elif method == "CRC16":
-        computed_control = calculate_crc16(data)
-    elif method == "CHECKSUM":
-        computed_control = calculate_internet_checksum(data)
-    elif method == "2D_PARITY":
-        computed_control = calculate_2d_parity(data)
-    else:
-        return None, "UNKNOWN METHOD"
+    computed_control = cache.get(method, data) if cache is not None else None
+    
+    if computed_control is None:
+        computed_control = compute_control(data, method)
+        if computed_control is None:
+            return None, "UNKNOWN METHOD"
+        if cache is not None:
+            cache.put(method, data, computed_control)
     
     # Karşılaştır
     is_correct = (computed_control == received_control)
@@ -149,7 +93,23 @@ def verify_data(data, method, received_control):
 
 
 
+def parse_args():
+    parser = argparse.ArgumentParser(description="Client 2 - Receiver + Error Checker")
+    parser.add_argument('--transport', choices=['tcp', 'shm'], default='tcp',
+                        help="tcp: loopback soket, shm: paylaşımlı bellek halka tamponu")
+    parser.add_argument('--cache-entries', type=int, default=1024,
+                        help="doğrulama önbelleğindeki en fazla kayıt sayısı (0: kapalı)")
+    parser.add_argument('--cache-bytes', type=int, default=1 << 20,
+                        help="doğrulama önbelleğinin byte cinsinden kapasitesi (veri UTF-8 boyutuyla sayılır)")
+    parser.add_argument('--adaptive-feedback', action='store_true',
+                        help="doğrulama sonuçlarını Client 1'in adaptif modu için kaydet")
+    parser.add_argument('--profile', type=int, default=0, metavar='N',
+                        help="N paket boyunca profil çıkar (flame graph + bellek özeti)")
+    return parser.parse_args()
+
 def main():
+    args = parse_args()
+
     CLIENT2_HOST = 'localhost'
     CLIENT2_PORT = 6666
     
@@ -157,25 +117,51 @@ def main():
     print("CLIENT 2 - RECEIVER + ERROR CHECKER")
     print("=" * 60)
     
-    # Socket oluştur
-    server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-    server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    cache = None
+    if args.cache_entries > 0 and args.cache_bytes > 0:
+        cache = VerificationCache(args.cache_entries, args.cache_bytes)
+    
+    verdicts = VerdictRecorder() if args.adaptive_feedback else None
+    
+    profiler = None
+    if args.profile > 0:
+        profiler = PacketProfiler('client2', args.profile)
+        profiler.start()
+    
+    # Socket veya halka tampon oluştur
+    server_socket = None
+    inbound_ring = None
     
     try:
-        server_socket.bind((CLIENT2_HOST, CLIENT2_PORT))
-        server_socket.listen(5)
+        if args.transport == 'shm':
+            inbound_ring = RingBuffer.create(ring_name(CLIENT2_PORT))
+            print(f"\n✓ Client 2 başlatıldı: {ring_name(CLIENT2_PORT)} (paylaşımlı bellek)")
+        else:
+            server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            server_socket.bind((CLIENT2_HOST, CLIENT2_PORT))
+            server_socket.listen(5)
+            print(f"\n✓ Client 2 başlatıldı: {CLIENT2_HOST}:{CLIENT2_PORT}")
         
-        print(f"\n✓ Client 2 başlatıldı: {CLIENT2_HOST}:{CLIENT2_PORT}")
         print("✓ Server'dan gelen veri bekleniyor...\n")
         
         while True:
-            # Server'dan bağlantı kabul et
-            conn, addr = server_socket.accept()
+            if inbound_ring is None:
+                # Server'dan bağlantı kabul et
+                conn, addr = server_socket.accept()
+                if profiler is not None:
+                    profiler.packet_start()
             
             try:
                 # Veriyi al
-                packet = conn.recv(4096).decode('utf-8')
-                conn.close()
+                if inbound_ring is not None:
+                    raw_packet = inbound_ring.recv()
+                    if profiler is not None:
+                        profiler.packet_start()
+                    packet = raw_packet.decode('utf-8')
+                else:
+                    packet = conn.recv(4096).decode('utf-8')
+                    conn.close()
                 
                 if not packet:
                     print("✗ Boş paket alındı!")
@@ -183,14 +169,28 @@ def main():
                 
                 # Paketi ayrıştır
                 parts = packet.split('|')
-                if len(parts) != 3:
+                if len(parts) == 3:
+                    parts.append(CODEC_NONE)
+                if len(parts) != 4:
                     print("✗ Hatalı paket formatı!")
                     continue
                 
-                received_data, method, received_control = parts
+                received_data, method, received_control, codec = parts
+                
+                # Kontrol bilgisini sıkıştırılmış form üzerinden yeniden hesapla
+                computed_control, status = verify_data(received_data, method, received_control, cache)
+                
+                # Veri yalnızca doğrulandıktan sonra açılır
+                if codec != CODEC_NONE and status == "DATA CORRECT ✓":
+                    try:
+                        received_data = decompress_text(received_data, codec)
+                    except ValueError as e:
+                        status = "DATA CORRUPTED ✗"
+                        print(f"✗ {e}")
                 
-                # Kontrol bilgisini yeniden hesapla
-                computed_control, status = verify_data(received_data, method, received_control)
+                # Client 1'in adaptif modu için sonucu kaydet
+                if verdicts is not None and computed_control is not None:
+                    verdicts.record(method, status != "DATA CORRECT ✓")
                 
                 # Sonuçları yazdır
                 print("=" * 60)
@@ -198,9 +198,12 @@ def main():
                 print("=" * 60)
                 print(f"Received Data        : {received_data}")
                 print(f"Method               : {method}")
+                print(f"Codec                : {codec}")
                 print(f"Sent Check Bits      : {received_control}")
                 print(f"Computed Check Bits  : {computed_control}")
                 print(f"Status               : {status}")
+                if cache is not None:
+                    print(f"Cache                : {cache.stats()}")
                 print("=" * 60)
                 print()
                 
@@ -223,13 +226,22 @@ def main():
             except Exception as e:
                 print(f"✗ Paket işlenirken hata: {e}\n")
                 continue
+            finally:
+                # Boş / hatalı paketler de sayılır
+                if profiler is not None:
+                    profiler.packet_done()
     
     except KeyboardInterrupt:
         print("\n\n✓ Client 2 kapatılıyor...")
     except Exception as e:
         print(f"\n✗ Client 2 hatası: {e}")
     finally:
-        server_socket.close()
+        if server_socket is not None:
+            server_socket.close()
+        if inbound_ring is not None:
+            inbound_ring.close()
+        if verdicts is not None:
+            verdicts.flush()
         print("✓ Client 2 kapatıldı.")
 
 if __name__ == "__main__":
@@ -0,0 +1,82 @@
+"""
+COMPRESSION - Kontrol bilgisi hesaplanmadan önce uygulanan sıkıştırma
+Client 1 metni sıkıştırıp Ascii85 ile '|' içermeyen metne çevirir, kontrol
+bilgisi bu sıkıştırılmış form üzerinden hesaplanır. Server ve Client 2 de
+aynı form üzerinde çalışır; veri yalnızca doğrulamadan sonra açılır.
+"""
+
+import base64
+import lzma
+import zlib
+
+# Pakette taşınan codec kimlikleri
+CODEC_NONE = 'N'
+CODEC_ZLIB = 'Z'
+CODEC_LZMA = 'L'
+
+# Bu boyuttan küçük veriler sıkıştırılmaz (başlık maliyeti kazancı yer)
+MIN_COMPRESS_SIZE = 64
+# Sıkıştırılmış metin orijinalin en fazla bu oranı kadar olmalı
+MAX_RATIO = 0.9
+# CPU eşikleri: büyük verilerde zlib hızlı seviyeye iner, lzma ise
+# yalnızca bu boyuttan büyük verilerde denenir
+ZLIB_FAST_SIZE = 1 << 20
+LZMA_MIN_SIZE = 64 * 1024
+
+
+def _compress(raw, codec):
+    if codec == CODEC_ZLIB:
+        level = 1 if len(raw) >= ZLIB_FAST_SIZE else 6
+        return zlib.compress(raw, level)
+    if codec == CODEC_LZMA:
+        return lzma.compress(raw, preset=1)
+    raise ValueError(f"Bilinmeyen codec: {codec}")
+
+
+def compress_text(data, codec='auto'):
+    """
+    Metni sıkıştırır ve (paket verisi, codec kimliği) döndürür.
+    codec: 'auto', 'zlib', 'lzma' veya 'off'.
+    Sıkıştırma kazançlı değilse veri olduğu gibi CODEC_NONE ile döner.
+    """
+    raw = data.encode('utf-8')
+    if codec == 'off' or len(raw) < MIN_COMPRESS_SIZE:
+        return data, CODEC_NONE
+
+    if codec == 'zlib':
+        candidates = [CODEC_ZLIB]
+    elif codec == 'lzma':
+        candidates = [CODEC_LZMA]
+    else:
+        candidates = [CODEC_ZLIB]
+        if len(raw) >= LZMA_MIN_SIZE:
+            candidates.append(CODEC_LZMA)
+
+    best_text, best_codec = data, CODEC_NONE
+    best_size = len(raw) * MAX_RATIO
+    for codec_id in candidates:
+        text = base64.a85encode(_compress(raw, codec_id)).decode('ascii')
+        if len(text) < best_size:
+            best_text, best_codec, best_size = text, codec_id, len(text)
+
+    return best_text, best_codec
+
+
+def decompress_text(data, codec_id):
+    """
+    Paket verisini açar. Bozulmuş veri açılamazsa ValueError fırlatır.
+    """
+    if codec_id == CODEC_NONE:
+        return data
+
+    try:
+        compressed = base64.a85decode(data.encode('ascii'))
+        if codec_id == CODEC_ZLIB:
+            raw = zlib.decompress(compressed)
+        elif codec_id == CODEC_LZMA:
+            raw = lzma.decompress(compressed)
+        else:
+            raise ValueError(f"Bilinmeyen codec: {codec_id}")
+        return raw.decode('utf-8')
+    except (ValueError, UnicodeError, zlib.error, lzma.LZMAError) as e:
+        raise ValueError(f"Veri açılamadı: {e}") from e
@@ -0,0 +1,25 @@
+"""
+ERROR DETECTION - Ortak kontrol bilgisi hesaplama kütüphanesi
+Client 1 ve Client 2 aynı implementasyonları bu paketten kullanır.
+Yöntemler wire id'leri ile kayıt defterinde tutulur; dağıtım O(1) sözlük
+araması ile yapılır.
+"""
+
+from .registry import Method, METHODS, register, get_method
+from .parity import calculate_even_parity, ParityStream
+from .crc import calculate_crc16, CRC16Stream
+from .checksum import calculate_internet_checksum, ChecksumStream
+from .parity2d import calculate_2d_parity, Parity2DStream, parity2d_method, parse_geometry
+
+register(Method('PARITY', 'Even Parity', calculate_even_parity, ParityStream))
+register(Method('CRC16', 'CRC-16', calculate_crc16, CRC16Stream))
+register(Method('CHECKSUM', 'Internet Checksum', calculate_internet_checksum, ChecksumStream))
+register(parity2d_method())
+
+__all__ = [
+    'Method', 'METHODS', 'register', 'get_method',
+    'calculate_even_parity', 'calculate_crc16',
+    'calculate_internet_checksum', 'calculate_2d_parity',
+    'ParityStream', 'CRC16Stream', 'ChecksumStream', 'Parity2DStream',
+    'parity2d_method', 'parse_geometry',
+]
@@ -0,0 +1,24 @@
+"""
+Ağır, isteğe bağlı hesaplama kütüphaneleri için tembel (lazy) yükleme.
+NumPy yalnızca büyük verilerde ilk ihtiyaç duyulduğunda içe aktarılır;
+kurulu değilse saf Python yolu kullanılır.
+"""
+
+_numpy = None
+_numpy_loaded = False
+
+# Bu boyuttan küçük verilerde NumPy'nin içe aktarma/dönüştürme maliyeti kazancı yer
+NUMPY_MIN_SIZE = 64 * 1024
+
+
+def numpy():
+    """NumPy modülünü döndürür; kurulu değilse None."""
+    global _numpy, _numpy_loaded
+    if not _numpy_loaded:
+        try:
+            import numpy as np
+            _numpy = np
+        except ImportError:
+            _numpy = None
+        _numpy_loaded = True
+    return _numpy
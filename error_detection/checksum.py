@@ -0,0 +1,57 @@
+"""
+Internet Checksum (IP Checksum): 16-bit kelimeler toplamının 1'e tümleyeni.
+"""
+
+# 2^16 ≡ 1 (mod 0xFFFF) olduğundan, byte dizisini tek bir büyük sayı
+# olarak okuyup 0xFFFF'e göre modunu almak, 16-bit kelimelerin taşma
+# eklemeli (end-around carry) toplamını verir.
+_MODULUS = 0xFFFF
+
+
+def _fold(remainder, nonzero):
+    # Taşma eklemeli toplam yalnızca tüm kelimeler 0 ise 0 olur
+    if remainder == 0 and nonzero:
+        return 0xFFFF
+    return remainder
+
+
+def calculate_internet_checksum(data):
+    """
+    Internet Checksum (IP Checksum) hesaplar.
+    16-bit kelimeler toplamının 1'e tümleyeni.
+    """
+    data_bytes = data.encode('utf-8')
+    # Tek sayıda byte varsa sonuna 0 ekle
+    if len(data_bytes) % 2 == 1:
+        data_bytes += b'\x00'
+
+    value = int.from_bytes(data_bytes, 'big')
+    total = _fold(value % _MODULUS, value != 0)
+    return format(~total & 0xFFFF, '04X')
+
+
+class ChecksumStream:
+    """Parça parça gelen metin için Internet Checksum."""
+
+    def __init__(self):
+        self.remainder = 0
+        self.nonzero = False
+        self.pending = b''
+
+    def update(self, chunk):
+        data_bytes = self.pending + chunk.encode('utf-8')
+        # Kelime sınırında kalmayan son byte bir sonraki parçaya devreder
+        even = len(data_bytes) - len(data_bytes) % 2
+        self.pending = data_bytes[even:]
+        value = int.from_bytes(data_bytes[:even], 'big')
+        self.remainder = (self.remainder + value) % _MODULUS
+        self.nonzero = self.nonzero or value != 0
+
+    def hexdigest(self):
+        remainder, nonzero = self.remainder, self.nonzero
+        if self.pending:
+            value = self.pending[0] << 8
+            remainder = (remainder + value) % _MODULUS
+            nonzero = nonzero or value != 0
+        total = _fold(remainder, nonzero)
+        return format(~total & 0xFFFF, '04X')
@@ -0,0 +1,40 @@
+"""
+CRC-16-CCITT (polinom 0x1021, başlangıç 0xFFFF).
+"""
+
+import binascii
+
+CRC16_INIT = 0xFFFF
+
+
+def _low_bytes(data):
+    """
+    Her karakterin ord değerinin düşük 8 bit'i.
+    Bit bit hesaplamada her adımda 16 bit'e maskelendiği için karakterin
+    yalnızca düşük byte'ı sonucu etkiler.
+    """
+    try:
+        return data.encode('latin-1')
+    except UnicodeEncodeError:
+        return data.encode('utf-32-le')[::4]
+
+
+def calculate_crc16(data):
+    """
+    CRC-16 hesaplar (CRC-16-CCITT polinomu kullanarak).
+    Polinom: x^16 + x^12 + x^5 + 1 (0x1021)
+    """
+    return format(binascii.crc_hqx(_low_bytes(data), CRC16_INIT), '04X')
+
+
+class CRC16Stream:
+    """Parça parça gelen metin için CRC-16."""
+
+    def __init__(self):
+        self.crc = CRC16_INIT
+
+    def update(self, chunk):
+        self.crc = binascii.crc_hqx(_low_bytes(chunk), self.crc)
+
+    def hexdigest(self):
+        return format(self.crc, '04X')
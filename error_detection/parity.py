@@ -0,0 +1,46 @@
+"""
+Even Parity: her karakter için ASCII değerindeki 1'lerin sayısı çift olmalı.
+"""
+
+from .backends import numpy, NUMPY_MIN_SIZE
+
+# byte -> b'0' / b'1' çeviri tablosu (bytes.translate ile tek geçişte)
+_PARITY_TABLE = bytes(ord('1') if bin(i).count('1') % 2 else ord('0') for i in range(256))
+
+
+def _parity_wide(data):
+    """Latin-1 dışı karakterler içeren metin için parite bitleri."""
+    np = numpy() if len(data) >= NUMPY_MIN_SIZE else None
+    if np is not None:
+        values = np.frombuffer(data.encode('utf-32-le'), dtype='<u4')
+        # 32 bit'i katlayarak paritesini en düşük bite indir
+        for shift in (16, 8, 4, 2, 1):
+            values = values ^ (values >> shift)
+        return ((values & 1) + ord('0')).astype('u1').tobytes().decode('ascii')
+
+    return ''.join('1' if bin(ord(char)).count('1') % 2 == 1 else '0' for char in data)
+
+
+def calculate_even_parity(data):
+    """
+    Even Parity hesaplar.
+    Her karakter için ASCII değerindeki 1'lerin sayısı çift olmalı.
+    """
+    try:
+        raw = data.encode('latin-1')
+    except UnicodeEncodeError:
+        return _parity_wide(data)
+    return raw.translate(_PARITY_TABLE).decode('ascii')
+
+
+class ParityStream:
+    """Parça parça gelen metin için Even Parity."""
+
+    def __init__(self):
+        self.parts = []
+
+    def update(self, chunk):
+        self.parts.append(calculate_even_parity(chunk))
+
+    def hexdigest(self):
+        return ''.join(self.parts)
@@ -0,0 +1,160 @@
+"""
+2D Parity: veri satır x sütun karakterlik karolara (tile) bölünür. Her
+karo için her satırın bir parite biti ve her sütun/bit pozisyonunun bir
+parite biti hesaplanır. Her karo sabit uzunlukta bir hex kod üretir; bu
+yüzden maliyet ve ek yük veri boyutuyla doğrusal artar.
+
+Varsayılan 8x8 karoda 64 karaktere kadar olan veriler için sonuç, eski
+tek matrisli 2D Parity ile aynıdır.
+"""
+
+from functools import partial
+
+from .parity import _PARITY_TABLE
+from .registry import Method
+
+DEFAULT_ROWS = 8
+DEFAULT_COLS = 8
+MAX_TILE_SIDE = 64
+PAD_CHAR = ' '
+
+# byte -> 0 / 1 (paritesi)
+_BIT_TABLE = bytes(value - ord('0') for value in _PARITY_TABLE)
+# 0/1 byte -> '0'/'1' karakteri
+_ASCII_BITS = bytes([ord('0'), ord('1')]) + bytes(254)
+
+
+def parse_geometry(text):
+    """'8x8' biçimindeki karo boyutunu (satır, sütun) olarak döndürür."""
+    try:
+        rows, cols = (int(part) for part in text.lower().split('x'))
+    except ValueError:
+        raise ValueError(f"Geçersiz karo boyutu: {text!r} (ör. 8x8)") from None
+    if not (1 <= rows <= MAX_TILE_SIDE and 1 <= cols <= MAX_TILE_SIDE):
+        raise ValueError(f"Karo boyutu 1-{MAX_TILE_SIDE} arasında olmalı: {text!r}")
+    return rows, cols
+
+
+def _columns_and_parities(data):
+    """
+    (sütun byte'ları, karakter pariteleri) döndürür.
+    256 ve üzeri karakterlerde sütun bitleri, ord değerinin ikili
+    gösterimindeki ilk 8 bit'tir; parite ise tüm bitler üzerindendir.
+    """
+    try:
+        raw = data.encode('latin-1')
+        return raw, raw.translate(_BIT_TABLE)
+    except UnicodeEncodeError:
+        pass
+
+    values = [ord(char) for char in data]
+    columns = bytes(v if v < 256 else v >> (v.bit_length() - 8) for v in values)
+    parities = bytes(bin(v).count('1') & 1 for v in values)
+    return columns, parities
+
+
+def _window_xor(data_bytes, unit, count):
+    """
+    Ardışık count adet unit byte'lık grubun XOR'u.
+    Byte dizisi tek bir sayı olarak kaydırılıp XOR'lanır; sonunda her
+    pencerenin son grubu o penceredeki tüm grupların XOR'unu taşır.
+    """
+    value = int.from_bytes(data_bytes, 'big')
+    window, window_size = 0, 0
+    doubled, doubled_size = value, 1
+    remaining = count
+    while remaining:
+        if remaining & 1:
+            window ^= doubled >> (window_size * unit * 8)
+            window_size += doubled_size
+        remaining >>= 1
+        if remaining:
+            doubled ^= doubled >> (doubled_size * unit * 8)
+            doubled_size *= 2
+    return window.to_bytes(len(data_bytes), 'big')
+
+
+def _pad(columns, parities, tile_size):
+    """Son karoyu boşlukla tamamlar; boş veri tek bir boş karo olur."""
+    pad_byte = ord(PAD_CHAR)
+    missing = (-len(columns)) % tile_size if columns else tile_size
+    return (columns + bytes([pad_byte]) * missing,
+            parities + bytes([_BIT_TABLE[pad_byte]]) * missing)
+
+
+def _tiles_to_hex(columns, parities, rows, cols):
+    """Tam karolardan oluşan veri için karo başına sabit uzunlukta hex üretir."""
+    tile_size = rows * cols
+    row_xor = _window_xor(parities, 1, cols)[cols - 1::cols]
+    col_xor = _window_xor(columns, cols, rows)
+
+    col_bits = cols * 8
+    total_bits = rows + col_bits
+    pad = (-total_bits) % 4
+    hex_format = f'0{(total_bits + pad) // 4}X'
+
+    parts = []
+    for tile in range(len(columns) // tile_size):
+        row_bits = row_xor[tile * rows:(tile + 1) * rows].translate(_ASCII_BITS)
+        last_row = (tile + 1) * tile_size - cols
+        column_value = int.from_bytes(col_xor[last_row:last_row + cols], 'big')
+        value = (int(row_bits, 2) << col_bits) | column_value
+        parts.append(format(value << pad, hex_format))
+    return ''.join(parts)
+
+
+def calculate_2d_parity(data, rows=DEFAULT_ROWS, cols=DEFAULT_COLS):
+    """
+    2D Parity hesaplar.
+    Veriyi rows x cols karakterlik karolara yerleştirir, her karo için
+    satır ve sütun pariteleri hesaplar.
+    """
+    columns, parities = _pad(*_columns_and_parities(data), rows * cols)
+    return _tiles_to_hex(columns, parities, rows, cols)
+
+
+class Parity2DStream:
+    """Parça parça gelen metin için 2D Parity; tamamlanan karolar hemen işlenir."""
+
+    def __init__(self, rows=DEFAULT_ROWS, cols=DEFAULT_COLS):
+        self.rows = rows
+        self.cols = cols
+        self.parts = []
+        self.pending_columns = b''
+        self.pending_parities = b''
+
+    def update(self, chunk):
+        columns, parities = _columns_and_parities(chunk)
+        columns = self.pending_columns + columns
+        parities = self.pending_parities + parities
+        tile_size = self.rows * self.cols
+        full = len(columns) - len(columns) % tile_size
+        self.pending_columns = columns[full:]
+        self.pending_parities = parities[full:]
+        if full:
+            self.parts.append(_tiles_to_hex(columns[:full], parities[:full], self.rows, self.cols))
+
+    def hexdigest(self):
+        parts = list(self.parts)
+        if self.pending_columns or not parts:
+            columns, parities = _pad(self.pending_columns, self.pending_parities,
+                                     self.rows * self.cols)
+            parts.append(_tiles_to_hex(columns, parities, self.rows, self.cols))
+        return ''.join(parts)
+
+
+def parity2d_method(rows=DEFAULT_ROWS, cols=DEFAULT_COLS):
+    """Verilen karo boyutu için kayıt defterine uygun Method oluşturur."""
+    if (rows, cols) == (DEFAULT_ROWS, DEFAULT_COLS):
+        wire_id = '2D_PARITY'
+    else:
+        wire_id = f'2D_PARITY:{rows}x{cols}'
+    return Method(wire_id, f'2D Parity ({rows}x{cols})',
+                  partial(calculate_2d_parity, rows=rows, cols=cols),
+                  partial(Parity2DStream, rows=rows, cols=cols),
+                  parity2d_variant)
+
+
+def parity2d_variant(params):
+    """'2D_PARITY:RxC' wire id'sindeki parametreden Method oluşturur."""
+    return parity2d_method(*parse_geometry(params))
@@ -0,0 +1,54 @@
+"""
+Kontrol yöntemi kayıt defteri.
+Her yöntem paketteki kimliğini (wire id), tek seferlik hızlı hesaplama
+fonksiyonunu ve parça parça veri alan akış (streaming) sınıfını bildirir.
+"""
+
+from collections import namedtuple
+
+# wire_id : pakette taşınan yöntem adı (ör. "CRC16")
+# name    : ekranda gösterilen ad
+# compute : compute(data) -> kontrol bilgisi
+# stream  : stream() -> update(chunk) / hexdigest() sağlayan nesne
+# variant : variant(params) -> "WIRE_ID:params" için parametreli Method
+#           (ör. "2D_PARITY:4x16"); parametre almayan yöntemlerde None
+Method = namedtuple('Method', ['wire_id', 'name', 'compute', 'stream', 'variant'],
+                    defaults=[None])
+
+METHODS = {}
+# Parametreli varyantlar ilk kullanımda oluşturulup kanonik wire id'leri
+# ile burada saklanır; boyutu geçerli parametre sayısıyla sınırlıdır
+_VARIANTS = {}
+
+
+def register(method):
+    """Yöntemi wire id'si ile kaydeder."""
+    if method.wire_id in METHODS:
+        raise ValueError(f"Yöntem zaten kayıtlı: {method.wire_id}")
+    METHODS[method.wire_id] = method
+    return method
+
+
+def get_method(wire_id):
+    """
+    Wire id'ye karşılık gelen yöntemi döndürür; bilinmiyorsa None.
+    Varyantlarda yalnızca kanonik yazım kabul edilir (ör. "2D_PARITY:4x16";
+    "2D_PARITY:04X16" veya varsayılan boyutu yazan "2D_PARITY:8x8" değil),
+    böylece ağdan gelen farklı yazımlar önbelleği büyütemez.
+    """
+    method = METHODS.get(wire_id) or _VARIANTS.get(wire_id)
+    if method is not None or ':' not in wire_id:
+        return method
+
+    base_id, params = wire_id.split(':', 1)
+    base = METHODS.get(base_id)
+    if base is None or base.variant is None:
+        return None
+    try:
+        method = base.variant(params)
+    except ValueError:
+        return None
+    if method.wire_id != wire_id:
+        return None
+    _VARIANTS[wire_id] = method
+    return method
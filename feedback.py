@@ -0,0 +1,184 @@
+"""
+FEEDBACK - Bağlantı kalitesi geri bildirimi ve adaptif yöntem seçimi
+Client 2 (--adaptive-feedback ile) son doğrulama sonuçlarını, Client 1
+ise adaptif modda yöntemlerin ölçülen hesaplama maliyetlerini küçük JSON
+dosyalarına yazar. Client 1'in adaptif modu bu iki kaynağa bakarak
+kontrol yöntemini seçer. Dosyalar çalışma dizininden bağımsız olarak bu
+modülün bulunduğu dizinde tutulur; okuma/yazma hataları paket akışını
+durdurmaz, yalnızca geri bildirim kaybolur.
+"""
+
+import json
+import os
+import time
+from collections import deque
+
+FEEDBACK_DIR = os.path.dirname(os.path.abspath(__file__))
+VERDICTS_FILE = os.path.join(FEEDBACK_DIR, 'link_verdicts.json')
+COSTS_FILE = os.path.join(FEEDBACK_DIR, 'method_costs.json')
+
+# Hata oranı bu son N sonuç üzerinden hesaplanır
+WINDOW = 50
+# Client 2 sonuçları bellekte tutar; dosyaya en fazla bu sıklıkla yazar
+FLUSH_EVERY = WINDOW
+FLUSH_INTERVAL = 1.0
+# Hata oranı eşikleri ve art arda bozulma (burst) eşiği
+LOW_ERROR_RATE = 0.05
+HIGH_ERROR_RATE = 0.20
+BURST_RUN = 3
+# Maliyet ölçümleri için üstel hareketli ortalama katsayısı
+COST_ALPHA = 0.3
+# Maliyet bilinmiyorsa ölçüm bu uzunlukta bir örnek üzerinde yapılır
+COST_SAMPLE_SIZE = 1024
+
+# Aynı pariteli yer değiştirme ve karakter değişimlerini göremeyen yöntemler.
+# Bunların "doğru" sonuçları bağlantıyı olduğundan temiz gösterir; hata
+# oranına katılmazlar.
+WEAK_METHODS = {'PARITY'}
+# Temiz bağlantıda zayıf yöntem seçiliyken en fazla bu kadar pakette bir
+# bağlantıyı ölçmek için PROBE_METHOD ile sonda paketi gönderilir
+PROBE_EVERY = 10
+PROBE_METHOD = 'CRC16'
+
+# Bağlantı durumuna göre aday yöntemler (en ucuzu seçilir)
+CANDIDATES = {
+    'clean': ['PARITY', 'CHECKSUM', '2D_PARITY', 'CRC16'],
+    'noisy': ['CHECKSUM', '2D_PARITY', 'CRC16'],
+    'burst': ['CRC16'],
+}
+
+
+def _load(path, default):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return default
+
+
+def _save(path, state):
+    """Durumu yazar; başarısızsa False döndürür (hata yukarı taşınmaz)."""
+    # Yarım yazılmış dosya okunmasın diye geçici dosya + os.replace
+    tmp_path = f"{path}.tmp"
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f)
+        os.replace(tmp_path, path)
+    except OSError:
+        return False
+    return True
+
+
+class VerdictRecorder:
+    """
+    Client 2: son WINDOW doğrulama sonucunu bellekte tutar. Dosyaya her
+    pakette değil, FLUSH_EVERY sonuçta bir ya da FLUSH_INTERVAL saniye
+    geçtiğinde yazar; flush() kapanışta kalanları yazar.
+    """
+
+    def __init__(self, path=VERDICTS_FILE, flush_every=FLUSH_EVERY, flush_interval=FLUSH_INTERVAL):
+        self.path = path
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        # Önceki çalıştırmanın penceresiyle devam et
+        self.verdicts = deque(_load(path, [])[-WINDOW:], maxlen=WINDOW)
+        self.pending = 0
+        self.last_flush = time.monotonic()
+
+    def record(self, method, corrupted):
+        self.verdicts.append({'method': method, 'corrupted': bool(corrupted)})
+        self.pending += 1
+        if (self.pending >= self.flush_every
+                or time.monotonic() - self.last_flush >= self.flush_interval):
+            self.flush()
+
+    def flush(self):
+        if self.pending:
+            _save(self.path, list(self.verdicts))
+            self.pending = 0
+        self.last_flush = time.monotonic()
+
+
+def record_cost(method, ns_per_byte, path=COSTS_FILE):
+    """Client 1: bir yöntemin byte başına maliyetini ortalamaya katar."""
+    costs = _load(path, {})
+    previous = costs.get(method)
+    if previous is None:
+        costs[method] = ns_per_byte
+    else:
+        costs[method] = (1 - COST_ALPHA) * previous + COST_ALPHA * ns_per_byte
+    _save(path, costs)
+
+
+def _is_reliable(verdict):
+    # '2D_PARITY:4x16' gibi varyantlar temel yöntemle aynı sınıftadır
+    return verdict['method'].split(':', 1)[0] not in WEAK_METHODS
+
+
+def link_state(verdicts):
+    """
+    Son sonuçlara göre bağlantı durumunu döndürür: 'clean', 'noisy' veya 'burst'.
+    Yalnızca WEAK_METHODS dışındaki yöntemlerin sonuçları sayılır.
+    Sondaki art arda bozulma sayısı BURST_RUN'a ulaşırsa 'burst' sayılır.
+    """
+    verdicts = [v for v in verdicts if _is_reliable(v)]
+    if not verdicts:
+        return 'clean', 0.0, 0
+
+    error_rate = sum(1 for v in verdicts if v['corrupted']) / len(verdicts)
+    run = 0
+    for verdict in reversed(verdicts):
+        if not verdict['corrupted']:
+            break
+        run += 1
+
+    if error_rate >= HIGH_ERROR_RATE or run >= BURST_RUN:
+        return 'burst', error_rate, run
+    if error_rate >= LOW_ERROR_RATE:
+        return 'noisy', error_rate, run
+    return 'clean', error_rate, run
+
+
+def measure_cost(func, data):
+    """func'ın data üzerindeki byte başına maliyetini (ns) ölçer."""
+    start = time.perf_counter_ns()
+    func(data)
+    elapsed = time.perf_counter_ns() - start
+    return elapsed / max(len(data), 1)
+
+
+def needs_probe(verdicts):
+    """
+    Son PROBE_EVERY sonucun hiçbiri güvenilir bir yöntemden gelmediyse
+    True döndürür (ör. temiz bağlantıda sürekli PARITY seçildiyse).
+    """
+    if len(verdicts) < PROBE_EVERY:
+        return False
+    return not any(_is_reliable(v) for v in verdicts[-PROBE_EVERY:])
+
+
+def choose_method(data, methods, verdicts_path=VERDICTS_FILE, costs_path=COSTS_FILE):
+    """
+    Adaptif yöntem seçimi. methods: {yöntem adı: hesaplama fonksiyonu}.
+    Bağlantı temizken ucuz yöntemlere, hata oranı ya da burst arttıkça
+    CRC'ye geçer; aday yöntemler arasından byte başına en ucuzunu seçer.
+    Temiz bağlantıda bağlantı yalnızca zayıf yöntemlerle izleniyorsa
+    PROBE_METHOD ile bir sonda paketi gönderilir.
+    (yöntem, bağlantı durumu, hata oranı) döndürür.
+    """
+    verdicts = _load(verdicts_path, [])
+    state, error_rate, _ = link_state(verdicts)
+    if state == 'clean' and needs_probe(verdicts):
+        return PROBE_METHOD, state, error_rate
+    costs = _load(costs_path, {})
+    sample = data[:COST_SAMPLE_SIZE]
+
+    best_method, best_cost = None, None
+    for method in CANDIDATES[state]:
+        cost = costs.get(method)
+        if cost is None:
+            cost = measure_cost(methods[method], sample)
+        if best_cost is None or cost < best_cost:
+            best_method, best_cost = method, cost
+
+    return best_method, state, error_rate
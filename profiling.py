@@ -0,0 +1,161 @@
+"""
+PROFILING - Paket bazlı profil çıkarma
+--profile N ile açılır. Belirtilen sayıda paket boyunca ana iş parçacığının
+yığını düzenli aralıklarla örneklenir ve tracemalloc ile bellek ayırmaları
+izlenir. Yalnızca paket işlenirken (packet_start() ile packet_done()
+arasında) örnek alınır; accept()/recv() içinde beklenen süre profile girmez. Sonuçlar iki dosyaya yazılır:
+  profile_<bileşen>_<pid>.collapsed  : flame graph araçları için (flamegraph.pl,
+                                       speedscope) "çerçeve;çerçeve;... sayı"
+  profile_<bileşen>_<pid>_alloc.txt  : paket başına bellek ayırma özeti
+"""
+
+import atexit
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+
+# Örnekleme aralığı (saniye)
+SAMPLE_INTERVAL = 0.001
+# tracemalloc'un her ayırma için sakladığı çerçeve sayısı
+ALLOC_FRAMES = 10
+# Özette gösterilen en çok bellek ayıran satır sayısı
+TOP_ALLOCATIONS = 15
+
+
+def _frame_label(frame, with_line=False):
+    # Satır numarası yalnızca yaprak çerçevede; aksi halde aynı fonksiyon
+    # flame graph'ta birden çok kardeş çerçeveye bölünür
+    code = frame.f_code
+    location = os.path.basename(code.co_filename)
+    if with_line:
+        location = f"{location}:{frame.f_lineno}"
+    return f"{code.co_name} ({location})"
+
+
+class PacketProfiler:
+    """
+    Örnekleyen profil çıkarıcı + tracemalloc.
+    start() çağıran iş parçacığı örneklenir. Her paket alındığında
+    packet_start(), işlendikten sonra packet_done() çağrılır;
+    num_packets pakete ulaşılınca raporlar yazılır.
+    """
+
+    def __init__(self, component, num_packets, interval=SAMPLE_INTERVAL, output_dir='.'):
+        self.component = component
+        self.num_packets = num_packets
+        self.interval = interval
+        self.output_dir = output_dir
+        self.samples = Counter()
+        self.packet_peaks = []
+        self.packet_growth = []
+        self.packets = 0
+        self.running = False
+        self.finished = False
+        self.active = threading.Event()
+        self.sampler = None
+
+    def start(self):
+        self.thread_id = threading.get_ident()
+        tracemalloc.start(ALLOC_FRAMES)
+        self.start_snapshot = tracemalloc.take_snapshot()
+        self.last_current = tracemalloc.get_traced_memory()[0]
+        self.started_at = time.perf_counter()
+
+        self.running = True
+        self.sampler = threading.Thread(target=self._sample, name="profiler-sampler", daemon=True)
+        self.sampler.start()
+        # Hedef paket sayısına ulaşılmadan çıkılırsa da raporlar yazılsın
+        atexit.register(self.finish)
+        print(f"✓ Profil açık: {self.num_packets} paket boyunca örnekleniyor")
+
+    def _sample(self):
+        while True:
+            # Paketler arasında (bağlantı beklenirken) örnek alınmaz
+            self.active.wait()
+            if not self.running:
+                break
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            if frame is not None:
+                stack.append(_frame_label(frame, with_line=True))
+                frame = frame.f_back
+            while frame is not None:
+                stack.append(_frame_label(frame))
+                frame = frame.f_back
+            # Yığın alınırken paket bitmişse örnek bekleme koduna aittir
+            if stack and self.active.is_set():
+                self.samples[';'.join(reversed(stack))] += 1
+            del frame
+            time.sleep(self.interval)
+
+    def packet_start(self):
+        """Bir paket alındı; örnekleme ve paket başına bellek ölçümü başlar."""
+        if self.finished:
+            return
+        tracemalloc.reset_peak()
+        self.last_current = tracemalloc.get_traced_memory()[0]
+        self.active.set()
+
+    def packet_done(self):
+        """Bir paket işlendi; hedef sayıya ulaşıldıysa raporları yazar."""
+        if self.finished or not self.active.is_set():
+            return
+        self.active.clear()
+        current, peak = tracemalloc.get_traced_memory()
+        self.packet_peaks.append(peak - self.last_current)
+        self.packet_growth.append(current - self.last_current)
+        self.packets += 1
+        if self.packets >= self.num_packets:
+            self.finish()
+
+    def finish(self):
+        """Örneklemeyi durdurur ve raporları yazar (birden fazla çağrılabilir)."""
+        if self.finished or not self.running:
+            return
+        self.finished = True
+        self.running = False
+        self.active.set()
+        self.sampler.join()
+        elapsed = time.perf_counter() - self.started_at
+
+        snapshot = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+        ignore = [tracemalloc.Filter(False, tracemalloc.__file__),
+                  tracemalloc.Filter(False, __file__)]
+        diff = snapshot.filter_traces(ignore).compare_to(
+            self.start_snapshot.filter_traces(ignore), 'lineno')
+
+        prefix = os.path.join(self.output_dir, f"profile_{self.component}_{os.getpid()}")
+        collapsed_path = f"{prefix}.collapsed"
+        alloc_path = f"{prefix}_alloc.txt"
+
+        with open(collapsed_path, 'w', encoding='utf-8') as f:
+            for stack, count in self.samples.most_common():
+                f.write(f"{stack} {count}\n")
+
+        with open(alloc_path, 'w', encoding='utf-8') as f:
+            self._write_alloc_summary(f, diff, elapsed)
+
+        print(f"\n✓ Profil yazıldı ({self.packets} paket, {sum(self.samples.values())} örnek):")
+        print(f"  Flame graph : {collapsed_path}")
+        print(f"  Bellek      : {alloc_path}")
+
+    def _write_alloc_summary(self, f, diff, elapsed):
+        packets = max(self.packets, 1)
+        f.write(f"Bileşen              : {self.component}\n")
+        f.write(f"Paket sayısı         : {self.packets}\n")
+        f.write(f"Süre                 : {elapsed:.3f} s\n")
+        if self.packet_peaks:
+            f.write(f"Paket başına tepe    : ort {sum(self.packet_peaks) / packets:,.0f} B, "
+                    f"en fazla {max(self.packet_peaks):,} B\n")
+            f.write(f"Paket başına artış   : ort {sum(self.packet_growth) / packets:,.0f} B\n")
+
+        f.write(f"\nEn çok bellek tutan satırlar (başlangıca göre, paket başına):\n")
+        for stat in diff[:TOP_ALLOCATIONS]:
+            frame = stat.traceback[0]
+            f.write(f"  {os.path.basename(frame.filename)}:{frame.lineno:<5} "
+                    f"{stat.size_diff / packets:>12,.0f} B/paket  "
+                    f"{stat.count_diff / packets:>8,.1f} blok/paket\n")
@@ -0,0 +1,232 @@
+"""
+RING BUFFER - Paylaşımlı Bellek Taşıma Katmanı
+Aynı makinede çalışan Client 1, Server ve Client 2 arasında paketleri
+TCP yerine multiprocessing.shared_memory üzerindeki tek üretici / tek
+tüketici (SPSC) halka tampon ile taşır. Boş tamponda bekleyen tüketici
+kısa bir dönüşten sonra tamponun yanındaki Unix datagram soketinde
+("kapı zili") bloklanır; üretici her çerçeveden sonra zile bir byte yollar.
+"""
+
+import os
+import socket
+import struct
+import tempfile
+import time
+from multiprocessing import shared_memory, resource_tracker
+
+try:
+    import fcntl
+except ImportError:  # Windows: üreticiler arası kilit yok
+    fcntl = None
+
+# Başlık: head (tüketici yazar), tail (üretici yazar), kapasite, sahip pid
+HEADER = struct.Struct('<QQQQ')
+OWNER_OFFSET = 24
+# Her çerçevenin önünde 4 byte uzunluk alanı bulunur
+LENGTH = struct.Struct('<I')
+
+DEFAULT_CAPACITY = 1 << 20  # 1 MB
+
+# Bekleme stratejisi: önce kısa süre dön, sonra zilde bloklan (tüketici)
+# ya da artan uykularla bekle (tampon dolu olduğunda üretici)
+SPIN_COUNT = 200
+MAX_SLEEP = 0.001
+
+
+def ring_name(port):
+    """TCP port numarasına karşılık gelen paylaşımlı bellek adını döndürür."""
+    return f"dataproje_{port}"
+
+
+def _side_path(name, suffix):
+    """Tampona eşlik eden kilit / zil dosyasının yolu."""
+    return os.path.join(tempfile.gettempdir(), f"{name}{suffix}")
+
+
+def _pid_alive(pid):
+    if pid <= 0:
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class RingBuffer:
+    """
+    Tek üretici / tek tüketici halka tampon.
+    head ve tail sürekli artan sayaçlardır; tampondaki konum sayaç % kapasite.
+    Üretici yalnızca tail'i, tüketici yalnızca head'i günceller. Birden
+    fazla üretici (ör. aynı anda çalışan iki Client 1) tail'i aynı anda
+    güncelleyemesin diye send() bir kilit dosyası üzerinde flock alır.
+    """
+
+    def __init__(self, shm, owner, bell, bell_path, lock_file=None):
+        self.shm = shm
+        self.owner = owner
+        self.bell = bell
+        self.bell_path = bell_path
+        self.lock_file = lock_file
+        self.capacity = HEADER.unpack_from(shm.buf, 0)[2]
+
+    @classmethod
+    def create(cls, name, capacity=DEFAULT_CAPACITY):
+        """
+        Tüketici tarafı: tamponu oluşturur (dinleyen soketin karşılığı).
+        Aynı adlı tampon çalışan bir sürece aitse FileExistsError fırlatır
+        (EADDRINUSE karşılığı); sahibi ölmüşse eski tampon silinir.
+        """
+        try:
+            existing = shared_memory.SharedMemory(name=name)
+        except FileNotFoundError:
+            existing = None
+
+        if existing is not None:
+            owner_pid = 0
+            if existing.size >= HEADER.size:
+                owner_pid = HEADER.unpack_from(existing.buf, 0)[3]
+            existing.close()
+            if _pid_alive(owner_pid):
+                resource_tracker.unregister(existing._name, 'shared_memory')
+                raise FileExistsError(f"Halka tampon zaten kullanımda: {name} (pid {owner_pid})")
+            existing.unlink()
+
+        shm = shared_memory.SharedMemory(name=name, create=True,
+                                         size=HEADER.size + capacity)
+        HEADER.pack_into(shm.buf, 0, 0, 0, capacity, os.getpid())
+
+        # Sahibi ölmüş tamponun zil dosyası da eskidir
+        bell_path = _side_path(name, '.bell')
+        try:
+            os.unlink(bell_path)
+        except FileNotFoundError:
+            pass
+        bell = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        bell.bind(bell_path)
+        return cls(shm, owner=True, bell=bell, bell_path=bell_path)
+
+    @classmethod
+    def attach(cls, name):
+        """
+        Üretici tarafı: var olan tampona bağlanır.
+        Tampon yoksa FileNotFoundError fırlatır (ConnectionRefusedError karşılığı).
+        """
+        if fcntl is None:
+            raise OSError("Üretici kilidi için fcntl gerekli; --transport shm bu platformda kullanılamaz")
+        shm = shared_memory.SharedMemory(name=name)
+        # Sahibi biz değiliz; resource_tracker çıkışta tamponu silmesin
+        resource_tracker.unregister(shm._name, 'shared_memory')
+        lock_file = open(_side_path(name, '.lock'), 'a')
+        bell = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        bell.setblocking(False)
+        return cls(shm, owner=False, bell=bell, bell_path=_side_path(name, '.bell'),
+                   lock_file=lock_file)
+
+    def _head(self):
+        return struct.unpack_from('<Q', self.shm.buf, 0)[0]
+
+    def _tail(self):
+        return struct.unpack_from('<Q', self.shm.buf, 8)[0]
+
+    def consumer_alive(self):
+        """Tamponu oluşturan tüketici süreç hâlâ çalışıyor mu?"""
+        return _pid_alive(struct.unpack_from('<Q', self.shm.buf, OWNER_OFFSET)[0])
+
+    def _write(self, pos, data):
+        start = pos % self.capacity
+        first = min(len(data), self.capacity - start)
+        base = HEADER.size
+        self.shm.buf[base + start:base + start + first] = data[:first]
+        if first < len(data):
+            self.shm.buf[base:base + len(data) - first] = data[first:]
+
+    def _read(self, pos, size):
+        start = pos % self.capacity
+        first = min(size, self.capacity - start)
+        base = HEADER.size
+        data = bytes(self.shm.buf[base + start:base + start + first])
+        if first < size:
+            data += bytes(self.shm.buf[base:base + size - first])
+        return data
+
+    def _wait(self, ready, timeout, bell=None):
+        """
+        ready() doğru olana kadar bekler; zaman aşımında False döndürür.
+        bell verilirse dönüşten sonra uyumak yerine zilde bloklanır.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        spins = 0
+        sleep = 0.00001
+        while not ready():
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return False
+            if spins < SPIN_COUNT:
+                spins += 1
+                continue
+            if bell is not None:
+                # Çerçeve zil çalmadan önce yayımlandığından uyanma kaçmaz;
+                # eski ziller yalnızca fazladan bir kontrol yaptırır
+                bell.settimeout(remaining)
+                try:
+                    bell.recv(64)
+                except socket.timeout:
+                    pass
+                continue
+            time.sleep(sleep)
+            sleep = min(sleep * 2, MAX_SLEEP)
+        return True
+
+    def send(self, payload, timeout=None):
+        """Bir çerçeveyi tampona yazar. Yer açılmazsa TimeoutError fırlatır."""
+        frame = LENGTH.pack(len(payload)) + payload
+        if len(frame) > self.capacity:
+            raise ValueError(f"Paket tampon kapasitesini aşıyor ({len(frame)} > {self.capacity})")
+
+        # tail'i oku-yaz-ilerlet adımları üreticiler arasında bölünmemeli
+        fcntl.flock(self.lock_file, fcntl.LOCK_EX)
+        try:
+            tail = self._tail()
+            if not self._wait(lambda: self.capacity - (tail - self._head()) >= len(frame), timeout):
+                raise TimeoutError("Halka tamponda yer açılmadı")
+
+            self._write(tail, frame)
+            # Veri yazıldıktan SONRA tail'i ilerlet
+            struct.pack_into('<Q', self.shm.buf, 8, tail + len(frame))
+        finally:
+            fcntl.flock(self.lock_file, fcntl.LOCK_UN)
+
+        # Tüketiciyi uyandır; zil kuyruğu doluysa tüketici zaten uyanacak
+        try:
+            self.bell.sendto(b'\x00', self.bell_path)
+        except (BlockingIOError, FileNotFoundError, ConnectionRefusedError):
+            pass
+
+    def recv(self, timeout=None):
+        """Sıradaki çerçeveyi okur. Zaman aşımında None döndürür."""
+        head = self._head()
+        if not self._wait(lambda: self._tail() - head >= LENGTH.size, timeout, self.bell):
+            return None
+
+        size = LENGTH.unpack(self._read(head, LENGTH.size))[0]
+        payload = self._read(head + LENGTH.size, size)
+        struct.pack_into('<Q', self.shm.buf, 0, head + LENGTH.size + size)
+        return payload
+
+    def close(self):
+        if self.lock_file is not None:
+            self.lock_file.close()
+        self.bell.close()
+        self.shm.close()
+        if self.owner:
+            try:
+                self.shm.unlink()
+            except FileNotFoundError:
+                pass
+            try:
+                os.unlink(self.bell_path)
+            except FileNotFoundError:
+                pass
@@ -4,8 +4,18 @@ SERVER - Intermediate Node + Data Corruptor
 Client 1'den veri alır, bozar ve Client 2'ye iletir.
 """
 
+import argparse
+import multiprocessing
 import socket
 import random
+import signal
+import sys
+import time
+from array import array
+
+from compression import CODEC_NONE
+from profiling import PacketProfiler
+from ring_buffer import RingBuffer, ring_name
 
 
 
@@ -110,28 +120,167 @@ def multiple_bit_flips(data):
 
 
 
+ERROR_METHODS = {
+    '1': ('Bit Flip', lambda d: bit_flip(d, 1)),
+    '2': ('Character Substitution', character_substitution),
+    '3': ('Character Deletion', character_deletion),
+    '4': ('Character Insertion', character_insertion),
+    '5': ('Character Swap', character_swap),
+    '6': ('Multiple Bit Flips', multiple_bit_flips),
+    '7': ('Burst Error', burst_error),
+}
+ERROR_TYPES = list(ERROR_METHODS)
+
 def corrupt_data(data, error_type=None):
     """
     Veriyi belirtilen veya rastgele hata tipiyle bozar.
     """
-    error_methods = {
-        '1': ('Bit Flip', lambda d: bit_flip(d, 1)),
-        '2': ('Character Substitution', character_substitution),
-        '3': ('Character Deletion', character_deletion),
-        '4': ('Character Insertion', character_insertion),
-        '5': ('Character Swap', character_swap),
-        '6': ('Multiple Bit Flips', multiple_bit_flips),
-        '7': ('Burst Error', burst_error),
-    }
-    
     if error_type is None:
-        error_type = random.choice(list(error_methods.keys()))
+        error_type = random.choice(ERROR_TYPES)
     
-    error_name, error_func = error_methods.get(error_type, ('Bit Flip', bit_flip))
+    error_name, error_func = ERROR_METHODS.get(error_type, ('Bit Flip', bit_flip))
     corrupted = error_func(data)
     
     return corrupted, error_name
 
+
+
+# ==================== ÖNCEDEN HESAPLANAN BOZMA PLANLARI ====================
+
+# Bir plan 32-bit rastgele sözcüklerden oluşur. Her uygulayıcı yalnızca
+# ihtiyaç duyduğu kadar sözcük okur (PLAN_WIDTHS); hata tipi sabitse plan o
+# kadar sözcüktür, rastgele tipte önce tip sözcüğü ve en geniş düzen gelir.
+# Aralığa indirgeme modulo ile değil (sözcük * n) >> 32 ölçeklemesiyle
+# yapılır (tek bir byte'ın % 26'sı A-V harflerini kayırırdı). Parti sözcük
+# dizisi olarak üretildiğinden aynı seed ve hata tipi, parti boyutundan
+# bağımsız olarak aynı planları verir.
+
+def _plan_index(word, length):
+    """32-bit rastgele sözcüğü [0, length) aralığına ölçekler."""
+    return (word * length) >> 32
+
+# Uygulayıcılar partinin sözcük dizisini ve planın ilk sözcüğünün indeksini
+# alır; paket başına plan nesnesi oluşturulmaz. Sıcak yolda _plan_index
+# çağrısı yerine aynı ölçekleme doğrudan yazılmıştır.
+
+def _planned_bit_flip(data, words, base, num_flips=1):
+    # [bit indeksleri (3'er bit), konum x num_flips]
+    data_bytes = bytearray(data.encode('utf-8'))
+    size = len(data_bytes)
+    if size == 0:
+        return data
+    bits = words[base]
+    for word in words[base + 1:base + 1 + num_flips]:
+        data_bytes[(word * size) >> 32] ^= 1 << (bits & 7)
+        bits >>= 3
+    return data_bytes.decode('utf-8', errors='replace')
+
+def _planned_substitution(data, words, base):
+    # [konum, harf]
+    if not data:
+        return data
+    idx = (words[base] * len(data)) >> 32
+    return data[:idx] + chr(65 + ((words[base + 1] * 26) >> 32)) + data[idx + 1:]
+
+def _planned_deletion(data, words, base):
+    # [konum]
+    if len(data) <= 1:
+        return data
+    idx = (words[base] * len(data)) >> 32
+    return data[:idx] + data[idx + 1:]
+
+def _planned_insertion(data, words, base):
+    # [konum, harf]
+    if not data:
+        return data
+    idx = (words[base] * (len(data) + 1)) >> 32
+    return data[:idx] + chr(97 + ((words[base + 1] * 26) >> 32)) + data[idx:]
+
+def _planned_swap(data, words, base):
+    # [konum]
+    if len(data) < 2:
+        return data
+    idx = (words[base] * (len(data) - 1)) >> 32
+    return data[:idx] + data[idx + 1] + data[idx] + data[idx + 2:]
+
+def _planned_burst(data, words, base):
+    # [uzunluk, başlangıç, harf x 8]; kısa veride substitution düzeni kullanılır
+    size = len(data)
+    if size < 3:
+        return _planned_substitution(data, words, base)
+    burst_length = 3 + ((words[base] * (min(8, size) - 2)) >> 32)
+    start_idx = (words[base + 1] * (size - burst_length + 1)) >> 32
+    burst = ''.join([chr(65 + ((word * 26) >> 32)) for word in words[base + 2:base + 2 + burst_length]])
+    return data[:start_idx] + burst + data[start_idx + burst_length:]
+
+def _planned_multiple_bit_flips(data, words, base):
+    # [çevirme sayısı, bit_flip düzeni (5 konum)]
+    return _planned_bit_flip(data, words, base + 1, 2 + ((words[base] * 4) >> 32))
+
+PLAN_APPLIERS = {
+    '1': _planned_bit_flip,
+    '2': _planned_substitution,
+    '3': _planned_deletion,
+    '4': _planned_insertion,
+    '5': _planned_swap,
+    '6': _planned_multiple_bit_flips,
+    '7': _planned_burst,
+}
+
+# Hata tipine göre planın sözcük sayısı
+PLAN_WIDTHS = {'1': 2, '2': 2, '3': 1, '4': 2, '5': 1, '6': 7, '7': 10}
+
+# Hata tipi -> (uygulayıcı, hata adı); partide her plan için bir kez seçilir
+PLAN_ACTIONS = {error_type: (applier, ERROR_METHODS[error_type][0])
+                for error_type, applier in PLAN_APPLIERS.items()}
+
+class CorruptionPlanner:
+    """
+    Bozma kararlarını (hata tipi, konumlar, bit indeksleri, yedek
+    karakterler) toplu olarak önceden üretir; her paket yalnızca sıradaki
+    planı uygular. Rastgele sözcükler tek çağrıda (randbytes) üretilir ve
+    parti başına bir kez çözülür; aynı seed ile çalıştırma tekrarlanabilir.
+    """
+
+    def __init__(self, error_type=None, seed=None, batch_size=4096):
+        self.error_type = error_type
+        self.batch_size = batch_size
+        self.rng = random.Random(seed)
+        if error_type is None:
+            # [tip, en geniş düzen]
+            self.plan_words = 1 + max(PLAN_WIDTHS.values())
+            self.offset = 1
+        else:
+            self.plan_words = PLAN_WIDTHS[error_type]
+            self.offset = 0
+        self.words = array('I')
+        self.actions = []
+        self.index = 0
+
+    def _refill(self):
+        words = array('I', self.rng.randbytes(4 * self.plan_words * self.batch_size))
+        if sys.byteorder == 'big':
+            # randbytes sözcükleri little-endian yazar
+            words.byteswap()
+        if self.error_type is not None:
+            self.actions = [PLAN_ACTIONS[self.error_type]] * self.batch_size
+        else:
+            types = len(ERROR_TYPES)
+            self.actions = [PLAN_ACTIONS[ERROR_TYPES[(word * types) >> 32]]
+                            for word in words[::self.plan_words]]
+        self.words = words
+        self.index = 0
+
+    def corrupt(self, data):
+        """Sıradaki planı uygular; (bozulmuş veri, hata adı) döndürür."""
+        index = self.index
+        if index >= len(self.actions):
+            self._refill()
+            index = 0
+        self.index = index + 1
+        applier, error_name = self.actions[index]
+        return applier(data, self.words, index * self.plan_words + self.offset), error_name
+
 def handle_client1(conn):
     """Client 1'den gelen veriyi alır."""
     try:
@@ -141,6 +290,14 @@ def handle_client1(conn):
         print(f"✗ Client 1'den veri alınırken hata: {e}")
         return None
 
+def handle_client1_frame(frame):
+    """Halka tampondan gelen çerçeveyi çözer; handle_client1 gibi hatada None döndürür."""
+    try:
+        return frame.decode('utf-8')
+    except UnicodeDecodeError as e:
+        print(f"✗ Client 1'den veri alınırken hata: {e}")
+        return None
+
 def send_to_client2(packet, client2_host, client2_port):
     """Bozulmuş paketi Client 2'ye gönderir."""
     try:
@@ -159,18 +316,363 @@ def send_to_client2(packet, client2_host, client2_port):
         print(f"✗ Client 2'ye gönderilirken hata: {e}")
         return False
 
+# Client 2 halka tamponlarına açık bağlantılar (ad -> RingBuffer); her pakette
+# yeniden bağlanmak (shm_open + mmap + kilit dosyası) iletimden pahalıdır
+_client2_rings = {}
+
+def _drop_client2_ring(client2_ring):
+    ring = _client2_rings.pop(client2_ring, None)
+    if ring is not None:
+        ring.close()
+
+def send_to_client2_shm(packet, client2_ring):
+    """
+    Bozulmuş paketi Client 2'nin paylaşımlı bellek halka tamponuna yazar.
+    Tampona bir kez bağlanılır; Client 2 yeniden başlatıldıysa ya da
+    gönderim başarısız olduysa sonraki pakette yeniden bağlanılır.
+    """
+    ring = _client2_rings.get(client2_ring)
+    if ring is not None and not ring.consumer_alive():
+        # Eski tüketici kapanmış; yeni Client 2 ayrı bir tampon oluşturur
+        _drop_client2_ring(client2_ring)
+        ring = None
+    
+    if ring is None:
+        try:
+            ring = RingBuffer.attach(client2_ring)
+        except FileNotFoundError:
+            print(f"✗ Client 2 halka tamponu bulunamadı ({client2_ring})")
+            print("  Lütfen önce Client 2'yi başlatın: python client2.py --transport shm")
+            return False
+        _client2_rings[client2_ring] = ring
+    
+    try:
+        ring.send(packet.encode('utf-8'), timeout=5)
+        return True
+    except Exception as e:
+        print(f"✗ Client 2'ye gönderilirken hata: {e}")
+        _drop_client2_ring(client2_ring)
+        return False
+
+
+
+# ==================== PAKET AKTARIMI ====================
+
+SERVER_HOST = 'localhost'
+SERVER_PORT = 5555
+CLIENT2_HOST = 'localhost'
+CLIENT2_PORT = 6666
+
+# Worker istatistik sayaçları (her worker için bir satır)
+STAT_RECEIVED = 0
+STAT_FORWARDED = 1
+STAT_FAILED = 2
+STAT_FIELDS = 3
+
+# Supervisor worker'ları bu aralıkla (saniye) kontrol eder
+SUPERVISOR_INTERVAL = 1.0
+# Bu süreden (saniye) önce çöken worker "hızlı çöktü" sayılır; art arda
+# hızlı çöküşlerde yeniden başlatma gecikmesi ikiye katlanır ve sınır
+# aşılınca worker bırakılır
+STABLE_UPTIME = 5.0
+MAX_BACKOFF = 30.0
+MAX_FAST_FAILURES = 5
+# Kapanışta worker'ların raporlarını yazması için beklenen süre (saniye);
+# sonra hâlâ çalışanlar sonlandırılır
+SHUTDOWN_TIMEOUT = 10.0
+
+def relay_packet(packet, planner, transport):
+    """
+    Paketi ayrıştırır, bozar ve Client 2'ye iletir.
+    İletildiyse True, gönderilemediyse False, paket geçersizse None döndürür.
+    """
+    if not packet:
+        print("✗ Geçersiz paket alındı!")
+        return None
+    
+    # Paketi ayrıştır
+    try:
+        parts = packet.split('|')
+        if len(parts) == 3:
+            parts.append(CODEC_NONE)
+        if len(parts) != 4:
+            print("✗ Hatalı paket formatı!")
+            return None
+        
+        # Veri sıkıştırılmışsa bozma işlemi sıkıştırılmış form üzerinde yapılır
+        original_data, method, control_info, codec = parts
+        
+        print(f"\nAlınan Paket:")
+        print(f"  Veri            : {original_data}")
+        print(f"  Yöntem          : {method}")
+        print(f"  Kontrol Bilgisi : {control_info}")
+        print(f"  Codec           : {codec}")
+        
+    except Exception as e:
+        print(f"✗ Paket ayrıştırılırken hata: {e}")
+        return None
+    
+    # Veriyi boz
+    corrupted_data, error_name = planner.corrupt(original_data)
+    
+    print(f"\nHata Enjeksiyonu:")
+    print(f"  Yöntem          : {error_name}")
+    print(f"  Orijinal        : {original_data}")
+    print(f"  Bozulmuş        : {corrupted_data}")
+    
+    # Yeni paketi oluştur (bozulmuş veri + orijinal kontrol bilgisi)
+    corrupted_packet = f"{corrupted_data}|{method}|{control_info}|{codec}"
+    
+    print(f"\nClient 2'ye gönderiliyor...")
+    
+    # Client 2'ye gönder
+    if transport == 'shm':
+        sent = send_to_client2_shm(corrupted_packet, ring_name(CLIENT2_PORT))
+    else:
+        sent = send_to_client2(corrupted_packet, CLIENT2_HOST, CLIENT2_PORT)
+    
+    if sent:
+        print(f"✓ Paket Client 2'ye iletildi!")
+    else:
+        print(f"✗ Paket Client 2'ye gönderilemedi!")
+    
+    print("-" * 60 + "\n")
+    print("Yeni bağlantı bekleniyor...\n")
+    return sent
+
+def create_listener(reuse_port=False, listen=True):
+    """
+    Client 1 için dinleyen soketi oluşturur.
+    listen=False ile yalnızca bağlanır (port müsait mi denemesi için).
+    """
+    server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    if reuse_port:
+        # Aynı porta bağlanan worker'lar arasında çekirdek bağlantıları dağıtır
+        server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+    try:
+        server_socket.bind((SERVER_HOST, SERVER_PORT))
+        if listen:
+            server_socket.listen(5)
+    except OSError:
+        server_socket.close()
+        raise
+    return server_socket
 
+def record_stat(stats, worker_id, result):
+    """relay_packet sonucunu worker'ın istatistik satırına işler."""
+    base = worker_id * STAT_FIELDS
+    stats[base + STAT_RECEIVED] += 1
+    if result:
+        stats[base + STAT_FORWARDED] += 1
+    else:
+        stats[base + STAT_FAILED] += 1
+
+# ==================== ÇOK ÇEKİRDEKLİ MOD ====================
+
+def _raise_interrupt(signum, frame):
+    raise KeyboardInterrupt
+
+def run_worker(worker_id, error_type, seed, stats, profile=0):
+    """
+    Worker süreci: SO_REUSEPORT ile 5555'e bağlanır ve kendi
+    al/boz/ilet döngüsünü çalıştırır. seed, supervisor'ın bu worker
+    (ve yeniden başlatma sayısı) için türettiği tohumdur.
+    """
+    # terminate() (SIGTERM) de Ctrl-C gibi finally bloğundan geçsin;
+    # aksi halde profil raporları yazılmadan süreç ölür
+    signal.signal(signal.SIGTERM, _raise_interrupt)
+    planner = CorruptionPlanner(error_type, seed)
+    server_socket = create_listener(reuse_port=True)
+    # accept() periyodik olarak uyanır; supervisor ölmüşse worker da kapanır
+    # (aksi halde sahipsiz worker'lar 5555'i dinlemeye devam eder)
+    server_socket.settimeout(SUPERVISOR_INTERVAL)
+    supervisor = multiprocessing.parent_process()
+    
+    # Her worker kendi profil dosyalarını (pid ile) yazar
+    profiler = None
+    if profile > 0:
+        profiler = PacketProfiler(f'server_worker{worker_id}', profile)
+        profiler.start()
+    
+    try:
+        while True:
+            try:
+                conn, addr = server_socket.accept()
+            except socket.timeout:
+                if not supervisor.is_alive():
+                    break
+                continue
+            if profiler is not None:
+                profiler.packet_start()
+            print("-" * 60)
+            print(f"✓ Client 1 bağlandı: {addr} (worker {worker_id})")
+            
+            packet = handle_client1(conn)
+            conn.close()
+            
+            try:
+                result = relay_packet(packet, planner, 'tcp')
+            except Exception as e:
+                print(f"✗ Paket işlenirken hata: {e}\n")
+                result = False
+            finally:
+                if profiler is not None:
+                    profiler.packet_done()
+            record_stat(stats, worker_id, result)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server_socket.close()
+        # Alt süreçlerde atexit çalışmaz; raporları burada yaz
+        if profiler is not None:
+            profiler.finish()
+
+def format_stats(stats, num_workers):
+    totals = [0] * STAT_FIELDS
+    for worker_id in range(num_workers):
+        for field in range(STAT_FIELDS):
+            totals[field] += stats[worker_id * STAT_FIELDS + field]
+    return (f"alınan: {totals[STAT_RECEIVED]}, iletilen: {totals[STAT_FORWARDED]}, "
+            f"başarısız: {totals[STAT_FAILED]}")
+
+def worker_seed(seed, worker_id, generation, num_workers):
+    """
+    Worker'ın bozma tohumu. İlk çalıştırmada seed + worker_id; yeniden
+    başlatılan worker aynı hata dizisini tekrar etmesin diye her yeniden
+    başlatmada num_workers kadar kaydırılır (çalıştırma içinde çakışmaz).
+    """
+    if seed is None:
+        return None
+    return seed + worker_id + generation * num_workers
+
+def run_supervisor(num_workers, error_type, seed, profile=0):
+    """
+    num_workers adet worker başlatır, çöken worker'ları artan gecikmeyle
+    yeniden başlatır ve istatistikleri toplar.
+    """
+    # Worker'lar bağlanamayacaksa başlatmadan önce hata ver (EADDRINUSE vb.)
+    try:
+        create_listener(reuse_port=True, listen=False).close()
+    except OSError as e:
+        print(f"\n✗ {SERVER_HOST}:{SERVER_PORT} dinlenemiyor: {e}")
+        sys.exit(1)
+    
+    # Sayaçlar supervisor'da tutulur; yeniden başlayan worker kaldığı yerden sayar
+    stats = multiprocessing.RawArray('q', num_workers * STAT_FIELDS)
+    workers = {}
+    started_at = {}
+    generations = [0] * num_workers
+    fast_failures = [0] * num_workers
+    pending = {}  # worker_id -> yeniden başlatma zamanı
+    restarts = 0
+    
+    def start_worker(worker_id):
+        process_seed = worker_seed(seed, worker_id, generations[worker_id], num_workers)
+        process = multiprocessing.Process(target=run_worker, name=f"relay-worker-{worker_id}",
+                                          args=(worker_id, error_type, process_seed, stats, profile),
+                                          daemon=True)
+        process.start()
+        workers[worker_id] = process
+        started_at[worker_id] = time.monotonic()
+    
+    for worker_id in range(num_workers):
+        start_worker(worker_id)
+    
+    print(f"\n✓ Server başlatıldı: {SERVER_HOST}:{SERVER_PORT} ({num_workers} worker, SO_REUSEPORT)")
+    print("✓ Client 1'den gelen bağlantı bekleniyor...\n")
+    
+    last_report = None
+    all_failed = False
+    interrupted = False
+    try:
+        while True:
+            time.sleep(SUPERVISOR_INTERVAL)
+            now = time.monotonic()
+            
+            for worker_id, process in list(workers.items()):
+                if process.is_alive():
+                    continue
+                del workers[worker_id]
+                if now - started_at[worker_id] >= STABLE_UPTIME:
+                    fast_failures[worker_id] = 0
+                fast_failures[worker_id] += 1
+                if fast_failures[worker_id] > MAX_FAST_FAILURES:
+                    print(f"✗ Worker {worker_id} art arda {fast_failures[worker_id]} kez hızlıca durdu "
+                          f"(çıkış kodu: {process.exitcode}); yeniden başlatılmayacak.")
+                    continue
+                delay = min(SUPERVISOR_INTERVAL * 2 ** (fast_failures[worker_id] - 1), MAX_BACKOFF)
+                print(f"✗ Worker {worker_id} durdu (çıkış kodu: {process.exitcode}), "
+                      f"{delay:.0f} s sonra yeniden başlatılıyor...")
+                pending[worker_id] = now + delay
+            
+            for worker_id, restart_at in list(pending.items()):
+                if now >= restart_at:
+                    del pending[worker_id]
+                    generations[worker_id] += 1
+                    restarts += 1
+                    start_worker(worker_id)
+            
+            if not workers and not pending:
+                print("✗ Çalışan worker kalmadı; server kapatılıyor.")
+                all_failed = True
+                break
+            
+            report = format_stats(stats, num_workers)
+            if report != last_report:
+                print(f"[İstatistik] {report}, yeniden başlatma: {restarts}")
+                last_report = report
+    
+    except KeyboardInterrupt:
+        interrupted = True
+        print("\n\n✓ Server kapatılıyor...")
+    finally:
+        # Ctrl-C süreç grubundaki worker'lara da gider; önce kendi
+        # finally bloklarını (profil raporları) bitirmelerini bekle
+        if interrupted:
+            deadline = time.monotonic() + SHUTDOWN_TIMEOUT
+            for process in workers.values():
+                process.join(max(0.0, deadline - time.monotonic()))
+        for process in workers.values():
+            if process.is_alive():
+                process.terminate()
+        for process in workers.values():
+            process.join()
+        print(f"✓ Toplam: {format_stats(stats, num_workers)}, yeniden başlatma: {restarts}")
+        print("✓ Server kapatıldı.")
+    
+    if all_failed:
+        sys.exit(1)
+
+# ==================== ANA PROGRAM ====================
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Server - Intermediate Node + Data Corruptor")
+    parser.add_argument('--transport', choices=['tcp', 'shm'], default='tcp',
+                        help="tcp: loopback soket, shm: paylaşımlı bellek halka tamponu")
+    parser.add_argument('--seed', type=int, default=None,
+                        help="bozma planları için tohum (aynı tohum aynı hataları üretir)")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="SO_REUSEPORT ile 5555'i paylaşan worker süreç sayısı")
+    parser.add_argument('--profile', type=int, default=0, metavar='N',
+                        help="N paket boyunca profil çıkar (flame graph + bellek özeti)")
+    return parser.parse_args()
 
 def main():
-    SERVER_HOST = 'localhost'
-    SERVER_PORT = 5555
-    CLIENT2_HOST = 'localhost'
-    CLIENT2_PORT = 6666
+    args = parse_args()
     
     print("=" * 60)
     print("SERVER - Intermediate Node + Data Corruptor")
     print("=" * 60)
     
+    if args.workers > 1:
+        if args.transport == 'shm':
+            print("✗ Halka tampon tek tüketicilidir; --workers yalnızca tcp ile kullanılabilir.")
+            sys.exit(1)
+        if not hasattr(socket, 'SO_REUSEPORT'):
+            print("✗ Bu platform SO_REUSEPORT desteklemiyor; --workers kullanılamaz.")
+            sys.exit(1)
+    
     # Hata tipi seçimi
     print("\nHata Enjeksiyon Yöntemi:")
     print("1. Bit Flip (tek bit)")
@@ -186,79 +688,77 @@ def main():
     if error_choice not in ['0', '1', '2', '3', '4', '5', '6', '7']:
         error_choice = '0'
     
-    # Socket oluştur
-    server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-    server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    error_type_to_use = None if error_choice == '0' else error_choice
+    
+    if args.workers > 1:
+        run_supervisor(args.workers, error_type_to_use, args.seed, args.profile)
+        return
+    
+    # Bozma planları toplu olarak önceden üretilir
+    planner = CorruptionPlanner(error_type_to_use, args.seed)
+    
+    profiler = None
+    if args.profile > 0:
+        profiler = PacketProfiler('server', args.profile)
+        profiler.start()
+    
+    # Socket veya halka tampon oluştur
+    server_socket = None
+    inbound_ring = None
     
     try:
-        server_socket.bind((SERVER_HOST, SERVER_PORT))
-        server_socket.listen(5)
+        if args.transport == 'shm':
+            inbound_ring = RingBuffer.create(ring_name(SERVER_PORT))
+            print(f"\n✓ Server başlatıldı: {ring_name(SERVER_PORT)} (paylaşımlı bellek)")
+        else:
+            server_socket = create_listener()
+            print(f"\n✓ Server başlatıldı: {SERVER_HOST}:{SERVER_PORT}")
         
-        print(f"\n✓ Server başlatıldı: {SERVER_HOST}:{SERVER_PORT}")
         print("✓ Client 1'den gelen bağlantı bekleniyor...\n")
         
         while True:
-            # Client 1'den bağlantı kabul et
-            conn, addr = server_socket.accept()
-            print("-" * 60)
-            print(f"✓ Client 1 bağlandı: {addr}")
-            
-            # Veriyi al
-            packet = handle_client1(conn)
-            conn.close()
-            
-            if not packet:
-                print("✗ Geçersiz paket alındı!")
-                continue
+            if inbound_ring is not None:
+                # Halka tampondan sıradaki paketi al
+                frame = inbound_ring.recv()
+                if profiler is not None:
+                    profiler.packet_start()
+                print("-" * 60)
+                print("✓ Client 1'den paket alındı (paylaşımlı bellek)")
+                packet = handle_client1_frame(frame)
+            else:
+                # Client 1'den bağlantı kabul et
+                conn, addr = server_socket.accept()
+                if profiler is not None:
+                    profiler.packet_start()
+                print("-" * 60)
+                print(f"✓ Client 1 bağlandı: {addr}")
+                
+                # Veriyi al
+                packet = handle_client1(conn)
+                conn.close()
             
-            # Paketi ayrıştır
+            # Tek bir paketteki hata relay'i durdurmamalı
             try:
-                parts = packet.split('|')
-                if len(parts) != 3:
-                    print("✗ Hatalı paket formatı!")
-                    continue
-                
-                original_data, method, control_info = parts
-                
-                print(f"\nAlınan Paket:")
-                print(f"  Veri            : {original_data}")
-                print(f"  Yöntem          : {method}")
-                print(f"  Kontrol Bilgisi : {control_info}")
-                
+                relay_packet(packet, planner, args.transport)
             except Exception as e:
-                print(f"✗ Paket ayrıştırılırken hata: {e}")
+                print(f"✗ Paket işlenirken hata: {e}\n")
                 continue
-            
-            # Veriyi boz
-            error_type_to_use = None if error_choice == '0' else error_choice
-            corrupted_data, error_name = corrupt_data(original_data, error_type_to_use)
-            
-            print(f"\nHata Enjeksiyonu:")
-            print(f"  Yöntem          : {error_name}")
-            print(f"  Orijinal        : {original_data}")
-            print(f"  Bozulmuş        : {corrupted_data}")
-            
-            # Yeni paketi oluştur (bozulmuş veri + orijinal kontrol bilgisi)
-            corrupted_packet = f"{corrupted_data}|{method}|{control_info}"
-            
-            print(f"\nClient 2'ye gönderiliyor...")
-            
-            # Client 2'ye gönder
-            if send_to_client2(corrupted_packet, CLIENT2_HOST, CLIENT2_PORT):
-                print(f"✓ Paket Client 2'ye iletildi!")
-            else:
-                print(f"✗ Paket Client 2'ye gönderilemedi!")
-            
-            print("-" * 60 + "\n")
-            print("Yeni bağlantı bekleniyor...\n")
+            finally:
+                if profiler is not None:
+                    profiler.packet_done()
     
     except KeyboardInterrupt:
         print("\n\n✓ Server kapatılıyor...")
     except Exception as e:
         print(f"\n✗ Server hatası: {e}")
     finally:
-        server_socket.close()
+        if server_socket is not None:
+            server_socket.close()
+        if inbound_ring is not None:
+            inbound_ring.close()
+        for client2_ring in list(_client2_rings):
+            _drop_client2_ring(client2_ring)
         print("✓ Server kapatıldı.")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()